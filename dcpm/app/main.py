@@ -31,6 +31,16 @@ def exception_hook(exctype, value, tb):
     sys.exit(1)
 
 
+def _profile_output(argv: list[str]) -> str | None:
+    """--profile[=文件]：用 cProfile 记录主线程，退出时写出 .prof 统计文件"""
+    for arg in argv:
+        if arg == "--profile":
+            return os.path.join(os.getcwd(), "dcpm.prof")
+        if arg.startswith("--profile="):
+            return arg.split("=", 1)[1] or os.path.join(os.getcwd(), "dcpm.prof")
+    return None
+
+
 def run(argv: list[str] | None = None) -> int:
     # Configure logging
     log_file = os.path.join(os.getcwd(), 'crash.log')
@@ -48,20 +58,36 @@ def run(argv: list[str] | None = None) -> int:
     if argv is None:
         argv = sys.argv
     smoke = "--smoke" in argv
+    profile_out = _profile_output(argv)
 
     os.environ.setdefault("QT_API", "pyqt6")
     app = QApplication(argv)
+    from PyQt6.QtGui import QPixmapCache
+    # 封面缩略图及按卡片尺寸合成的圆角成品统一放在 QPixmapCache，单位 KB
+    QPixmapCache.setCacheLimit(50 * 1024)
     from qfluentwidgets import Theme, setTheme, setThemeColor
     from dcpm.ui.main_window import MainWindow
 
     setTheme(Theme.LIGHT)
     setThemeColor(PRIMARY_COLOR)
 
-    window = MainWindow()
-    if smoke:
-        _ = window
-        return 0
+    profiler = None
+    if profile_out:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        window = MainWindow()
+        if smoke:
+            _ = window
+            return 0
 
-    window.show()
+        window.show()
 
-    return app.exec()
+        return app.exec()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_out)
+            logging.info(f"Profile written to {profile_out}")
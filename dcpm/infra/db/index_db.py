@@ -13,12 +13,15 @@ class IndexDb:
     fts5_enabled: bool
 
 
+def index_db_path(library_root: Path) -> Path:
+    return Path(library_root) / ".pm_system" / "index.sqlite"
+
+
 def open_index_db(library_root: Path) -> IndexDb:
-    root = Path(library_root)
-    pm_dir = root / ".pm_system"
+    db_path = index_db_path(library_root)
+    pm_dir = db_path.parent
     pm_dir.mkdir(parents=True, exist_ok=True)
     (pm_dir / "cache").mkdir(parents=True, exist_ok=True)
-    db_path = pm_dir / "index.sqlite"
 
     conn = sqlite3.connect(str(db_path))
     try:
@@ -26,7 +29,9 @@ def open_index_db(library_root: Path) -> IndexDb:
         conn.execute("PRAGMA synchronous=NORMAL;")
         _ensure_schema(conn)
         fts5_enabled = _try_enable_fts5(conn)
-        conn.execute("PRAGMA user_version=2;")
+        # 版本号已是最新时不再写库，避免每次打开都改动文件 mtime
+        if conn.execute("PRAGMA user_version;").fetchone()[0] != 2:
+            conn.execute("PRAGMA user_version=2;")
         conn.commit()
     finally:
         conn.close()
@@ -35,7 +40,8 @@ def open_index_db(library_root: Path) -> IndexDb:
 
 
 def connect(db: IndexDb) -> sqlite3.Connection:
-    conn = sqlite3.connect(str(db.path))
+    # 语句缓存按 SQL 文本命中，常驻连接上重复的查询不再重新编译
+    conn = sqlite3.connect(str(db.path), cached_statements=128)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys=ON;")
     conn.execute("PRAGMA journal_mode=WAL;")
@@ -362,32 +368,57 @@ def mark_project_opened(conn: sqlite3.Connection, project_id: str, open_time: st
     )
 
 
+def _search_filters(
+    status: str | None,
+    month: str | None,
+    pinned_only: bool,
+) -> tuple[str, list[Any]]:
+    """状态 / 月份 / 置顶筛选拼成 WHERE 片段（针对别名 p）"""
+    clauses: list[str] = []
+    params: list[Any] = []
+    if status:
+        clauses.append("p.status = ?")
+        params.append(status)
+    if month:
+        clauses.append("p.month = ?")
+        params.append(month)
+    if pinned_only:
+        clauses.append("p.pinned = 1")
+    sql = "".join(f" AND {c}" for c in clauses)
+    return sql, params
+
+
 def search_project_ids(
     conn: sqlite3.Connection,
     query: str,
     limit: int,
     fts5_enabled: bool,
     include_archived: bool = False,
+    status: str | None = None,
+    month: str | None = None,
+    pinned_only: bool = False,
+    offset: int = 0,
 ) -> list[str]:
     q = query.strip()
+    filter_sql, filter_params = _search_filters(status, month, pinned_only)
     if not q:
         rows = conn.execute(
-            """
-            SELECT id
-            FROM projects
-            WHERE (? = 1) OR status != 'archived'
+            f"""
+            SELECT p.id
+            FROM projects p
+            WHERE ((? = 1) OR p.status != 'archived'){filter_sql}
             ORDER BY
-                pinned DESC,
-                datetime(COALESCE(last_open_time, create_time)) DESC
-            LIMIT ?;
+                p.pinned DESC,
+                datetime(COALESCE(p.last_open_time, p.create_time)) DESC
+            LIMIT ? OFFSET ?;
             """,
-            (1 if include_archived else 0, limit),
+            (1 if include_archived else 0, *filter_params, limit, offset),
         ).fetchall()
         return [str(r["id"]) for r in rows]
 
     if fts5_enabled:
         rows = conn.execute(
-            """
+            f"""
             WITH hits AS (
                 SELECT id AS project_id, bm25(project_fts) AS score
                 FROM project_fts
@@ -409,26 +440,26 @@ def search_project_ids(
             SELECT project_id
             FROM best
             JOIN projects p ON p.id = best.project_id
-            WHERE (? = 1) OR p.status != 'archived'
+            WHERE ((? = 1) OR p.status != 'archived'){filter_sql}
             ORDER BY
                 p.pinned DESC,
                 best.score ASC,
                 datetime(COALESCE(p.last_open_time, p.create_time)) DESC
-            LIMIT ?;
+            LIMIT ? OFFSET ?;
             """,
-            (_fts_query(q), _fts_query(q), _fts_query(q), 1 if include_archived else 0, limit),
+            (_fts_query(q), _fts_query(q), _fts_query(q), 1 if include_archived else 0, *filter_params, limit, offset),
         ).fetchall()
         return [str(r["project_id"]) for r in rows]
 
     like = f"%{q}%"
     rows = conn.execute(
-        """
+        f"""
         SELECT p.id
         FROM projects p
         LEFT JOIN files f ON f.project_id = p.id
         LEFT JOIN item_tags it ON it.project_id = p.id
         WHERE
-            ((? = 1) OR p.status != 'archived')
+            ((? = 1) OR p.status != 'archived'){filter_sql}
             AND (
             p.id LIKE ?
             OR p.customer LIKE ?
@@ -447,9 +478,9 @@ def search_project_ids(
         ORDER BY
             p.pinned DESC,
             datetime(COALESCE(p.last_open_time, p.create_time)) DESC
-        LIMIT ?;
+        LIMIT ? OFFSET ?;
         """,
-        (1 if include_archived else 0, like, like, like, like, like, like, like, like, like, like, like, limit),
+        (1 if include_archived else 0, *filter_params, like, like, like, like, like, like, like, like, like, like, like, limit, offset),
     ).fetchall()
     return [str(r["id"]) for r in rows]
 
@@ -457,11 +488,18 @@ def search_project_ids(
 def fetch_projects_by_ids(conn: sqlite3.Connection, ids: list[str]) -> list[dict[str, Any]]:
     if not ids:
         return []
-    placeholders = ",".join("?" for _ in ids)
-    rows = conn.execute(
-        f"SELECT * FROM projects WHERE id IN ({placeholders});",
-        tuple(ids),
-    ).fetchall()
+    try:
+        # id 列表作为一个 JSON 参数传入，SQL 文本固定，可命中语句缓存
+        rows = conn.execute(
+            "SELECT * FROM projects WHERE id IN (SELECT value FROM json_each(?));",
+            (json.dumps(ids, ensure_ascii=False),),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        placeholders = ",".join("?" for _ in ids)
+        rows = conn.execute(
+            f"SELECT * FROM projects WHERE id IN ({placeholders});",
+            tuple(ids),
+        ).fetchall()
     by_id = {str(r["id"]): dict(r) for r in rows}
     return [by_id[i] for i in ids if i in by_id]
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
+import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +18,7 @@ from dcpm.infra.db.index_db import (
     get_popular_tags,
     get_recent_activity_raw,
     get_stats,
+    index_db_path,
     mark_project_opened,
     open_index_db,
     replace_project_item_tags,
@@ -31,6 +35,8 @@ from dcpm.services.library_service import ProjectEntry, list_projects
 class SearchResult:
     entries: list[ProjectEntry]
     fts5_enabled: bool
+    # 本页取满 limit 行，后面可能还有（按 offset 继续取）
+    has_more: bool = False
 
 
 @dataclass(frozen=True)
@@ -43,26 +49,91 @@ class DashboardStats:
     month_counts: list[tuple[str, int]]
 
 
-def delete_project_index(library_root: Path, project_id: str) -> None:
-    db = open_index_db(library_root)
+# 统计 / 最近动态的查询结果缓存，按库文件（含 WAL）的 mtime 判断是否过期；
+# 本模块内的写操作也会直接清空
+_stats_cache: dict[Path, tuple[tuple[int, int], DashboardStats]] = {}
+_activity_cache: dict[tuple[Path, int], tuple[tuple[int, int], list[dict[str, str]]]] = {}
+
+
+def _db_stamp(db_path: Path) -> tuple[int, int]:
+    stamps = []
+    for p in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            stamps.append(os.stat(p).st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+    return stamps[0], stamps[1]
+
+
+def _invalidate_caches() -> None:
+    _stats_cache.clear()
+    _activity_cache.clear()
+
+
+# 建表 / FTS 检测每个库只做一次；连接按线程常驻复用（sqlite3 连接不能跨线程）
+_index_dbs: dict[Path, IndexDb] = {}
+_local = threading.local()
+
+
+def _index_db(library_root: Path) -> IndexDb:
+    db_path = index_db_path(library_root)
+    db = _index_dbs.get(db_path)
+    if db is None or not db_path.exists():
+        db = _index_dbs[db_path] = open_index_db(library_root)
+    return db
+
+
+def _thread_conn(db: IndexDb) -> sqlite3.Connection:
+    conns: dict[Path, tuple[IndexDb, sqlite3.Connection]] | None = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    cached = conns.get(db.path)
+    if cached is not None and cached[0] is db:
+        return cached[1]
+    if cached is not None:
+        # 库文件被重建过，旧连接作废
+        cached[1].close()
     conn = connect(db)
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    conn.execute("PRAGMA cache_size=-20000;")  # 约 20MB 页缓存，常驻连接上长期有效
+    conns[db.path] = (db, conn)
+    return conn
+
+
+def _release(conn: sqlite3.Connection) -> None:
+    """用完不关闭连接；未提交的写入回滚，与原先直接 close 的效果一致"""
+    if conn.in_transaction:
+        conn.rollback()
+
+
+def delete_project_index(library_root: Path, project_id: str) -> None:
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
         delete_project(conn, project_id)
     finally:
-        conn.close()
+        _release(conn)
+        _invalidate_caches()
 
 
 def get_dashboard_stats(library_root: Path) -> DashboardStats:
-    db = open_index_db(library_root)
-    conn = connect(db)
+    # 戳在查询前取：查询期间若有写入，下次比对必然不一致
+    db_path = index_db_path(library_root)
+    stamp = _db_stamp(db_path)
+    cached = _stats_cache.get(db_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
         stats = get_stats(conn)
         tags = get_popular_tags(conn, limit=10)
         months = get_month_counts(conn)
     finally:
-        conn.close()
+        _release(conn)
 
-    return DashboardStats(
+    result = DashboardStats(
         total_projects=stats["total"],
         processing_count=stats["processing"],
         completed_count=stats["completed"],
@@ -70,15 +141,23 @@ def get_dashboard_stats(library_root: Path) -> DashboardStats:
         popular_tags=tags,
         month_counts=months,
     )
+    _stats_cache[db_path] = (stamp, result)
+    return result
 
 
 def get_recent_activity(library_root: Path, limit: int = 10) -> list[dict[str, str]]:
-    db = open_index_db(library_root)
-    conn = connect(db)
+    db_path = index_db_path(library_root)
+    stamp = _db_stamp(db_path)
+    cached = _activity_cache.get((db_path, limit))
+    if cached is not None and cached[0] == stamp:
+        return list(cached[1])
+
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
         raw = get_recent_activity_raw(conn, limit)
     finally:
-        conn.close()
+        _release(conn)
 
     result = []
     for r in raw:
@@ -94,7 +173,8 @@ def get_recent_activity(library_root: Path, limit: int = 10) -> list[dict[str, s
                 "time": str(r.get("last_open_time") or r["create_time"]),
             }
         )
-    return result
+    _activity_cache[(db_path, limit)] = (stamp, result)
+    return list(result)
 
 
 def ensure_index(library_root: Path) -> IndexDb:
@@ -112,11 +192,11 @@ def rebuild_index(
     Args:
         progress_callback: 可选的进度回调函数，接收 (当前项目数, 总项目数) 参数
     """
-    db = open_index_db(library_root)
+    db = _index_db(library_root)
     entries = list_projects(Path(library_root), include_archived=include_archived)
     total = len(entries)
 
-    conn = connect(db)
+    conn = _thread_conn(db)
     try:
         for i, entry in enumerate(entries, 1):
             upsert_project(
@@ -154,14 +234,15 @@ def rebuild_index(
                 progress_callback(i, total)
         conn.commit()
     finally:
-        conn.close()
+        _release(conn)
+        _invalidate_caches()
 
     return db
 
 
 def upsert_one_project(library_root: Path, entry: ProjectEntry) -> IndexDb:
-    db = open_index_db(library_root)
-    conn = connect(db)
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
         upsert_project(
             conn,
@@ -193,35 +274,64 @@ def upsert_one_project(library_root: Path, entry: ProjectEntry) -> IndexDb:
         )
         conn.commit()
     finally:
-        conn.close()
+        _release(conn)
+        _invalidate_caches()
     return db
 
 
 def toggle_pinned(library_root: Path, project_id: str, pinned: bool) -> None:
-    db = open_index_db(library_root)
-    conn = connect(db)
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
         set_project_pinned(conn, project_id, pinned)
         conn.commit()
     finally:
-        conn.close()
+        _release(conn)
+        _invalidate_caches()
 
 
 def mark_opened_now(library_root: Path, project_id: str) -> None:
-    db = open_index_db(library_root)
-    conn = connect(db)
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
         mark_project_opened(conn, project_id, datetime.now().isoformat(timespec="seconds"))
         conn.commit()
     finally:
-        conn.close()
+        _release(conn)
+        _invalidate_caches()
 
 
-def search(library_root: Path, query: str, limit: int = 200, include_archived: bool = False) -> SearchResult:
-    db = open_index_db(library_root)
-    conn = connect(db)
+def search(
+    library_root: Path,
+    query: str,
+    limit: int = 200,
+    include_archived: bool = False,
+    status: str | None = None,
+    month: str | None = None,
+    pinned_only: bool = False,
+    offset: int = 0,
+) -> SearchResult:
+    """
+    按关键字检索项目
+
+    Args:
+        status / month / pinned_only: 可选筛选，直接在 SQL 中过滤，只返回命中的行
+        offset: 分页起点；失效的行会被顺带删除，下一页应从 offset + len(entries) 开始
+    """
+    db = _index_db(library_root)
+    conn = _thread_conn(db)
     try:
-        ids = search_project_ids(conn, query, limit, db.fts5_enabled, include_archived=include_archived)
+        ids = search_project_ids(
+            conn,
+            query,
+            limit,
+            db.fts5_enabled,
+            include_archived=include_archived,
+            status=status,
+            month=month,
+            pinned_only=pinned_only,
+            offset=offset,
+        )
         rows = fetch_projects_by_ids(conn, ids)
         stale_ids: list[str] = []
         kept_rows: list[dict] = []
@@ -237,8 +347,9 @@ def search(library_root: Path, query: str, limit: int = 200, include_archived: b
             for project_id in stale_ids:
                 delete_project(conn, project_id)
             rows = kept_rows
+            _invalidate_caches()
     finally:
-        conn.close()
+        _release(conn)
 
     entries: list[ProjectEntry] = []
     for row in rows:
@@ -287,7 +398,7 @@ def search(library_root: Path, query: str, limit: int = 200, include_archived: b
                 open_count=int(row.get("open_count") or 0),
             )
         )
-    return SearchResult(entries=entries, fts5_enabled=db.fts5_enabled)
+    return SearchResult(entries=entries, fts5_enabled=db.fts5_enabled, has_more=len(ids) == limit)
 
 
 # 索引时跳过的目录（缓存、临时文件等）
@@ -9,7 +9,7 @@ from dcpm.domain.project import Project
 from dcpm.infra.fs.metadata import read_project_metadata
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectEntry:
     project: Project
     project_dir: Path
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
 import re
 import shutil
+import subprocess
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -206,6 +209,11 @@ def edit_project_metadata(
     return p, current_dir
 
 
+def cover_preview_path(project_dir: Path, w: int, h: int) -> Path:
+    """管理对话框封面预览的缩略图缓存（按像素尺寸区分），与封面放在同一目录"""
+    return Path(project_dir) / ".pm_cover" / f"cover_preview_{w}x{h}.png"
+
+
 def set_project_cover(project_dir: Path, source_image_path: Path | str) -> Project:
     project_dir = Path(project_dir)
     meta_path = project_dir / ".project.json"
@@ -224,7 +232,8 @@ def set_project_cover(project_dir: Path, source_image_path: Path | str) -> Proje
     cover_dir = project_dir / ".pm_cover"
     cover_dir.mkdir(parents=True, exist_ok=True)
 
-    for old in cover_dir.glob("cover.*"):
+    # 旧封面连同其预览缩略图一起删掉（copy2 保留源文件 mtime，不能只靠 mtime 判断缩略图过期）
+    for old in [*cover_dir.glob("cover.*"), *cover_dir.glob("cover_preview_*")]:
         try:
             old.unlink(missing_ok=True)
         except Exception:
@@ -322,3 +331,50 @@ def delete_project_physically(project_dir: Path) -> None:
         return
     # shutil.rmtree handles non-empty directories
     shutil.rmtree(str(path))
+
+
+def _trash_root(library_root: Path) -> Path:
+    return ensure_pm_system(Path(library_root)) / "trash"
+
+
+def trash_project_dir(library_root: Path, project_dir: Path) -> bool:
+    """
+    把项目文件夹改名移入 .pm_system/trash（同卷内只改目录项，瞬间完成），真正的删除交给 purge_trash
+
+    Returns:
+        True 表示已移入回收目录、需要调用 purge_trash；无法改名（跨卷、文件被占用等）时
+        退回直接删除并返回 False
+    """
+    path = Path(project_dir)
+    if not path.exists():
+        return False
+    trash = _trash_root(library_root)
+    trash.mkdir(parents=True, exist_ok=True)
+    try:
+        os.rename(path, trash / uuid.uuid4().hex)
+    except OSError:
+        delete_project_physically(path)
+        return False
+    return True
+
+
+def purge_trash(library_root: Path) -> list[Path]:
+    """
+    清空回收目录（耗时，应在后台线程执行）；启动时也调用一次，清理上次未删完的残留
+
+    Returns:
+        删除后仍然存在的条目（文件被占用、权限不足等），下次清理时会再尝试
+    """
+    trash = _trash_root(library_root)
+    if not trash.is_dir():
+        return []
+    leftover: list[Path] = []
+    for item in trash.iterdir():
+        if os.name == "nt":
+            shutil.rmtree(item, ignore_errors=True)
+        else:
+            # 大目录树上 rm -rf 明显快于 shutil.rmtree
+            subprocess.run(["rm", "-rf", "--", str(item)], check=False)
+        if item.exists():
+            leftover.append(item)
+    return leftover
@@ -1,9 +1,20 @@
 from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
-from PyQt6.QtGui import QColor, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap
+from PyQt6.QtCore import Qt, QRectF
 from qfluentwidgets import CardWidget
 from dcpm.ui.theme.colors import COLORS
 
+# 统计卡片的样式表与数值无关，导入时生成一次
+_STAT_TITLE_QSS = f"color: {COLORS['text_muted']}; font-size: 13px;"
+_STAT_SUB_QSS = f"color: {COLORS['text_muted']}; font-size: 12px;"
+_STAT_CARD_QSS = f"""
+    StatCard {{
+        background-color: {COLORS['card']};
+        border-radius: 16px;
+    }}
+"""
+
+
 class ShadowCard(CardWidget):
     """带精致阴影的卡片基类"""
     
@@ -31,6 +42,52 @@ class ShadowCard(CardWidget):
         self.setShadowEffect()
         super().leaveEvent(event)
 
+class _ProgressBar(QWidget):
+    """统计卡片进度条：底槽 + 填充渲染成一张 QPixmap，按尺寸/颜色缓存，重绘时只贴图"""
+    _pix_cache: dict[tuple[str, int, int, float], QPixmap] = {}
+
+    def __init__(self, color, progress, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(6)
+        self._color = color
+        self.set_progress(progress)
+
+    def set_progress(self, progress):
+        fill = int(max(0, min(1, progress)) * 200) # 简单模拟宽度，实际应根据父容器计算
+        if fill == getattr(self, "_fill", None):
+            return
+        self._fill = fill
+        self.update()
+
+    def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        key = (self._color, self.width(), self._fill, dpr)
+        pix = self._pix_cache.get(key)
+        if pix is None:
+            if len(self._pix_cache) > 64:
+                self._pix_cache.clear()
+            pix = self._pix_cache[key] = self._render(self.width(), self.height(), dpr)
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pix)
+        painter.end()
+
+    def _render(self, w, h, dpr):
+        pix = QPixmap(max(1, round(w * dpr)), max(1, round(h * dpr)))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(COLORS['border']))
+        painter.drawRoundedRect(QRectF(0, 0, w, h), 3, 3)
+        fill = min(self._fill, w)
+        if fill > 0:
+            painter.setBrush(QColor(self._color))
+            painter.drawRoundedRect(QRectF(0, 0, fill, h), 3, 3)
+        painter.end()
+        return pix
+
+
 class StatCard(QWidget):
     """顶部统计卡片"""
     
@@ -51,7 +108,7 @@ class StatCard(QWidget):
         
         # 标题
         title_label = QLabel(self.title)
-        title_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 13px;")
+        title_label.setStyleSheet(_STAT_TITLE_QSS)
         layout.addWidget(title_label)
         
         # 数值和进度
@@ -59,6 +116,7 @@ class StatCard(QWidget):
         
         # 大数字
         value_label = QLabel(str(self.value))
+        self._value_label = value_label
         value_font = QFont("Segoe UI", 32, QFont.Weight.Bold)
         value_label.setFont(value_font)
         value_label.setStyleSheet(f"color: {self.color};")
@@ -68,40 +126,31 @@ class StatCard(QWidget):
         
         # 副标题
         sub_label = QLabel(self.subtitle)
-        sub_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 12px;")
+        self._sub_label = sub_label
+        sub_label.setStyleSheet(_STAT_SUB_QSS)
         value_layout.addWidget(sub_label)
         
         layout.addLayout(value_layout)
         
         # 进度条
-        progress_container = QWidget()
-        progress_container.setFixedHeight(6)
-        progress_container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {COLORS['border']};
-                border-radius: 3px;
-            }}
-        """)
-        
-        progress_bar = QWidget(progress_container)
-        progress_bar.setFixedHeight(6)
-        progress_bar.setFixedWidth(int(max(0, min(1, self.progress)) * 200)) # 简单模拟宽度，实际应根据父容器计算
-        progress_bar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.color};
-                border-radius: 3px;
-            }}
-        """)
-        
-        layout.addWidget(progress_container)
+        self._progress_bar = _ProgressBar(self.color, self.progress)
+        layout.addWidget(self._progress_bar)
         
         # 白色背景
-        self.setStyleSheet(f"""
-            StatCard {{
-                background-color: {COLORS['card']};
-                border-radius: 16px;
-            }}
-        """)
+        self.setStyleSheet(_STAT_CARD_QSS)
+
+    def set_values(self, value, subtitle, progress):
+        """只更新数值、副标题和进度，不重建控件；未变化的部分不触发重新布局和重绘"""
+        if (value, subtitle, progress) == (self.value, self.subtitle, self.progress):
+            return
+        if value != self.value:
+            self._value_label.setText(str(value))
+        if subtitle != self.subtitle:
+            self._sub_label.setText(subtitle)
+        self.value = value
+        self.subtitle = subtitle
+        self.progress = progress
+        self._progress_bar.set_progress(progress)
 
     def resizeEvent(self, event):
         # 简单的响应式进度条调整
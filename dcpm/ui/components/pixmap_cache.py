@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRectF, QRunnable, QThreadPool
+from PyQt6.QtGui import QColor, QImage, QImageReader, QPainter, QPainterPath, QPixmap, QPixmapCache
+
+from dcpm.ui.theme.colors import COLORS
+
+
+# 封面缓存副本的最长边，绘制时再由 QPainter 缩放到卡片尺寸
+COVER_MAX_SIDE = 480
+
+# 封面键：(文件路径, mtime)。像素图放在 QPixmapCache（受全局上限约束），平均色单独做 LRU
+CoverKey = tuple[str, int]
+
+_AVG_COLOR_LIMIT = 240
+_avg_colors: OrderedDict[CoverKey, QColor] = OrderedDict()
+_pending: set[CoverKey] = set()
+# 解码失败的封面不再反复排队
+_failed: set[CoverKey] = set()
+_signals: "_CoverSignals | None" = None
+
+
+def _average_color(img: QImage) -> QColor:
+    """金字塔式逐级减半（快速采样），剩下不超过 8x8 时再平滑缩到 1x1"""
+    while img.width() > 8 or img.height() > 8:
+        img = img.scaled(
+            max(1, img.width() // 2),
+            max(1, img.height() // 2),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.FastTransformation,
+        )
+    small = img.scaled(1, 1, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return small.pixelColor(0, 0)
+
+
+class _CoverSignals(QObject):
+    decoded = pyqtSignal(object, QImage, QColor)  # key, image, avg color（线程池 -> GUI 线程）
+    loaded = pyqtSignal(object)  # key，已写入缓存
+
+
+class _CoverDecodeRunnable(QRunnable):
+    """在线程池中解码封面（按最长边缩放读取），并顺带算出平均色"""
+
+    def __init__(self, key: CoverKey, signals: _CoverSignals):
+        super().__init__()
+        self._key = key
+        self._signals = signals
+
+    def run(self) -> None:
+        reader = QImageReader(self._key[0])
+        # 按内容识别格式（扩展名不符时也能读），并按 EXIF 方向摆正，与管理对话框的预览一致
+        reader.setDecideFormatFromContent(True)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and (size.width() > COVER_MAX_SIDE or size.height() > COVER_MAX_SIDE):
+            reader.setScaledSize(size.scaled(COVER_MAX_SIDE, COVER_MAX_SIDE, Qt.AspectRatioMode.KeepAspectRatio))
+        img = reader.read()
+        color = _average_color(img) if not img.isNull() else QColor(COLORS["primary_light"])
+        try:
+            self._signals.decoded.emit(self._key, img, color)
+        except RuntimeError:
+            pass
+
+
+def cover_signals() -> _CoverSignals:
+    global _signals
+    if _signals is None:
+        _signals = _CoverSignals()
+        _signals.decoded.connect(_store)
+    return _signals
+
+
+def _store(key: CoverKey, img: QImage, color: QColor) -> None:
+    _pending.discard(key)
+    _avg_colors[key] = color
+    _avg_colors.move_to_end(key)
+    while len(_avg_colors) > _AVG_COLOR_LIMIT:
+        _avg_colors.popitem(last=False)
+    if img.isNull():
+        _failed.add(key)
+    else:
+        QPixmapCache.insert(pixmap_key(key), QPixmap.fromImage(img))
+    cover_signals().loaded.emit(key)
+
+
+def pixmap_key(key: CoverKey) -> str:
+    return f"cover:{key[0]}:{key[1]}:{COVER_MAX_SIDE}"
+
+
+def cover_pixmap(key: CoverKey) -> QPixmap | None:
+    """只查缓存，不做同步解码"""
+    pix = QPixmapCache.find(pixmap_key(key))
+    if pix is None or pix.isNull():
+        return None
+    return pix
+
+
+def cover_color(key: CoverKey) -> QColor | None:
+    color = _avg_colors.get(key)
+    if color is not None:
+        _avg_colors.move_to_end(key)
+    return color
+
+
+def is_ready(key: CoverKey, need_pixmap: bool) -> bool:
+    """缓存里已有所需数据（或已知无法解码），不必再排队"""
+    if key in _failed:
+        return True
+    if need_pixmap:
+        return cover_pixmap(key) is not None
+    return key in _avg_colors
+
+
+def request_cover(key: CoverKey) -> None:
+    """缓存未命中时把解码放到全局线程池；同一封面只排队一次，完成后发出 loaded(key)"""
+    if key in _pending or key in _failed:
+        return
+    _pending.add(key)
+    QThreadPool.globalInstance().start(_CoverDecodeRunnable(key, cover_signals()))
+
+
+def _crop_rect(pix: QPixmap, target: QRectF) -> QRectF:
+    """等价于 KeepAspectRatioByExpanding + 居中裁剪的源矩形"""
+    pw, ph = pix.width(), pix.height()
+    scale = max(target.width() / pw, target.height() / ph)
+    sw = target.width() / scale
+    sh = target.height() / scale
+    return QRectF((pw - sw) / 2, (ph - sh) / 2, sw, sh)
+
+
+def rounded_pixmap(
+    src: QPixmap,
+    w: int,
+    h: int,
+    radius: float,
+    dpr: float,
+    cache_key: str,
+    overlay: QPixmap | None = None,
+) -> QPixmap:
+    """把图片居中裁剪到 w x h 并裁成圆角（可叠加一层遮罩），成品放进 QPixmapCache；
+    绘制时只需一次 drawPixmap，不再逐帧缩放和裁剪"""
+    key = f"{cache_key}|{w}x{h}|r{radius:g}@{dpr:g}"
+    cached = QPixmapCache.find(key)
+    if cached is not None and not cached.isNull():
+        return cached
+
+    target = QPixmap(max(1, round(w * dpr)), max(1, round(h * dpr)))
+    target.setDevicePixelRatio(dpr)
+    target.fill(Qt.GlobalColor.transparent)
+    rect = QRectF(0, 0, w, h)
+    path = QPainterPath()
+    path.addRoundedRect(rect, radius, radius)
+
+    painter = QPainter(target)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+    painter.setClipPath(path)
+    painter.drawPixmap(rect, src, _crop_rect(src, rect))
+    if overlay is not None:
+        painter.drawPixmap(rect, overlay, QRectF(overlay.rect()))
+    painter.end()
+
+    QPixmapCache.insert(key, target)
+    return target
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QTimer, QPoint
-from PyQt6.QtGui import QFont, QCursor, QPainter, QPainterPath, QPixmap, QColor, QLinearGradient, QGuiApplication
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QRectF, QTimer, QPoint, QSize
+from PyQt6.QtGui import (
+    QFont, QCursor, QPainter, QPainterPath, QPixmap, QColor, QLinearGradient, QGuiApplication, QIcon,
+    QFontMetrics, QPixmapCache,
+)
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -22,6 +27,166 @@ from qfluentwidgets import IconWidget, FluentIcon as FI, CheckBox
 from dcpm.services.library_service import ProjectEntry
 from dcpm.ui.theme.colors import COLORS
 from dcpm.ui.components.cards import ShadowCard
+from dcpm.ui.components import pixmap_cache
+
+
+# 卡片样式表在导入时一次性生成，避免每张卡片重复格式化与解析
+_STYLES: dict[str, str] = {
+    "card": f"""
+        ProjectCard {{
+            background-color: transparent;
+            border-radius: 12px;
+            border: 1px solid {COLORS['border']};
+        }}
+        ProjectCard:hover {{
+            border: 1px solid {COLORS['primary_light']};
+        }}
+    """,
+    "card_special": """
+        ProjectCard {
+            background-color: #F3E5F5;
+            border-radius: 12px;
+            border: 1px solid #CE93D8;
+        }
+        ProjectCard:hover {
+            border: 1px solid #AB47BC;
+            background-color: #E1BEE7;
+        }
+    """,
+    "code_label": f"color: {COLORS['primary']}; font-size: 11px; font-weight: bold;",
+    "cust_label": f"color: {COLORS['text_muted']}; font-size: 12px;",
+    "special_label": "color: #9C27B0; font-size: 11px; font-weight: bold;",
+    "pin_on": f"""
+        QPushButton {{
+            border: none;
+            color: {COLORS['warning']};
+            font-size: 16px;
+            background: transparent;
+        }}
+        QPushButton:hover {{ background: {COLORS['bg']}; border-radius: 4px; }}
+    """,
+    "pin_off": f"""
+        QPushButton {{
+            border: none;
+            color: {COLORS['text_muted']};
+            font-size: 16px;
+            background: transparent;
+        }}
+        QPushButton:hover {{ background: {COLORS['bg']}; border-radius: 4px; }}
+    """,
+    "icon_btn": f"""
+        QPushButton {{
+            border: none;
+            background: transparent;
+        }}
+        QPushButton:hover {{ background: {COLORS['bg']}; border-radius: 4px; }}
+    """,
+    "del_btn": """
+        QPushButton {
+            border: none;
+            background: transparent;
+        }
+        QPushButton:hover { background: #fee2e2; border-radius: 4px; }
+    """,
+    "name_label": f"color: {COLORS['text']};",
+    "part_label": f"color: {COLORS['primary']};",
+    "date_label": f"color: {COLORS['text_muted']}; font-size: 11px;",
+    "open_btn_grid": f"""
+        QPushButton {{
+            background-color: {COLORS['bg']};
+            color: {COLORS['text']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 13px;
+            padding: 0 12px;
+            font-size: 12px;
+        }}
+        QPushButton:hover {{
+            background-color: {COLORS['primary']};
+            color: white;
+            border: 1px solid {COLORS['primary']};
+        }}
+    """,
+    "compact_icon": f"color: {COLORS['primary']};",
+    "compact_name": f"font-weight: bold; font-size: 13px; color: {COLORS['text']};",
+    "compact_part": f"font-weight: bold; font-size: 12px; color: {COLORS['primary']};",
+    "compact_meta": f"color: {COLORS['text_muted']}; font-size: 11px;",
+    "compact_pin_on": f"border: none; color: {COLORS['warning']}; background: transparent;",
+    "compact_pin_off": f"border: none; color: {COLORS['text_muted']}; background: transparent;",
+    "compact_icon_btn": "border: none; background: transparent;",
+    "open_btn_compact": f"""
+        QPushButton {{
+            background-color: {COLORS['bg']};
+            border: 1px solid {COLORS['border']};
+            border-radius: 4px;
+            padding: 0 8px;
+            font-size: 11px;
+        }}
+        QPushButton:hover {{ background-color: {COLORS['border']}; }}
+    """,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _fi_icon(fi: FI) -> QIcon:
+    """按进程缓存 FluentIcon 生成的 QIcon，所有卡片共用同一实例"""
+    return fi.icon()
+
+
+class _FolderBadge(QWidget):
+    """渐变底 + 文件夹图标，直接绘制，代替容器 QWidget + 布局 + IconWidget"""
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setFixedSize(48, 48)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        grad = QLinearGradient(0, 0, self.width(), self.height())
+        grad.setColorAt(0.0, QColor(COLORS["primary_light"]))
+        grad.setColorAt(1.0, QColor(COLORS["primary"]))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(grad)
+        painter.drawRoundedRect(QRectF(self.rect()), 12, 12)
+        _fi_icon(FI.FOLDER).paint(painter, 12, 12, 24, 24)
+        painter.end()
+
+
+class _TagStrip(QWidget):
+    """一行只读标签，整体绘制，代替每个标签一个 QLabel"""
+
+    def __init__(self, tags: list[str], pad_x: int, spacing: int, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._texts = [f"#{t}" for t in tags]
+        self._pad_x = pad_x
+        self._spacing = spacing
+        font = self.font()
+        font.setPixelSize(11)
+        self.setFont(font)
+        fm = QFontMetrics(font)
+        self._widths = [fm.horizontalAdvance(t) + pad_x * 2 for t in self._texts]
+        self._h = fm.height() + 4
+        w = sum(self._widths) + spacing * max(0, len(self._widths) - 1)
+        self.setFixedSize(QSize(w, self._h))
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        bg = QColor(COLORS["bg"])
+        fg = QColor(COLORS["text_muted"])
+        x = 0
+        for text, w in zip(self._texts, self._widths):
+            rect = QRectF(x, 0, w, self._h)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(bg)
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(fg)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+            x += w + self._spacing
+        painter.end()
+
 
 @dataclass(frozen=True)
 class ProjectCardOptions:
@@ -32,8 +197,18 @@ class ProjectCardOptions:
 
 class ProjectCard(ShadowCard):
     """精致的项目卡片"""
-    _bg_pixmap_cache: dict[tuple[str, int, int, int], QPixmap] = {}
-    _bg_color_cache: dict[tuple[str, int], QColor] = {}
+    _overlay_cache: OrderedDict[tuple[int, int], QPixmap] = OrderedDict()
+    _clip_path_cache: OrderedDict[tuple[int, int], QPainterPath] = OrderedDict()
+
+    # 绘制用颜色只构造一次
+    _CARD_COLOR = QColor(COLORS["card"])
+    _SPECIAL_COLOR = QColor("#F3E5F5")
+    _FROSTED = QColor(255, 255, 255, 135)
+    _GRAD_STOPS = (
+        (0.0, QColor(255, 255, 255, 200)),
+        (0.55, QColor(255, 255, 255, 110)),
+        (1.0, QColor(255, 255, 255, 10)),
+    )
 
     openRequested = pyqtSignal(object)
     pinToggled = pyqtSignal(str, bool)
@@ -48,27 +223,26 @@ class ProjectCard(ShadowCard):
         self._options = options or ProjectCardOptions()
         self._cover_preview_timer: QTimer | None = None
         self._cover_popup: _CoverViewerPopup | None = None
+        self._pending_cover: tuple[str, int] | None = None
+        # 封面路径与 mtime 在创建时解析一次，绘制时不再 stat
+        self._cover_file = self._cover_path()
+        self._cover_mtime = self._get_cover_mtime(self._cover_file) if self._cover_file else 0
         
         # 基础样式
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.setFixedHeight(180 if not self._options.compact else 80)
+        compact = self._options.compact
+        self.setFixedHeight(180 if not compact else 80)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.setStyleSheet(f"""
-            ProjectCard {{
-                background-color: transparent;
-                border-radius: 12px;
-                border: 1px solid {COLORS['border']};
-            }}
-            ProjectCard:hover {{
-                border: 1px solid {COLORS['primary_light']};
-            }}
-        """)
+        self.setStyleSheet(_STYLES["card"])
         
-        self._build()
+        # 卡片形态由 options 固定，构建函数在这里一次性选定
+        build = self._build_compact if compact else self._build_grid
+        build()
+        self._prewarm_cover()
 
     def _open_cover_preview(self) -> None:
         self._cover_preview_timer = None
-        cover_path = self._cover_path()
+        cover_path = self._cover_file
         if not cover_path:
             return
         if self._cover_popup is not None and self._cover_popup.isVisible():
@@ -111,13 +285,19 @@ class ProjectCard(ShadowCard):
         return None
 
     @classmethod
-    def _cache_put(cls, cache: dict, key, value, limit: int) -> None:
+    def _cache_get(cls, cache: OrderedDict, key):
+        value = cache.get(key)
+        if value is not None:
+            # LRU：命中后移到末尾，最久未使用的留在队首等待淘汰
+            cache.move_to_end(key)
+        return value
+
+    @classmethod
+    def _cache_put(cls, cache: OrderedDict, key, value, limit: int) -> None:
         cache[key] = value
+        cache.move_to_end(key)
         while len(cache) > limit:
-            try:
-                cache.pop(next(iter(cache)))
-            except Exception:
-                break
+            cache.popitem(last=False)
 
     @classmethod
     def _get_cover_mtime(cls, path: Path) -> int:
@@ -126,51 +306,68 @@ class ProjectCard(ShadowCard):
         except Exception:
             return 0
 
+    def _prewarm_cover(self) -> None:
+        """缓存未命中时把封面解码放到线程池，完成前 paintEvent 不做同步解码"""
+        cover_path = self._cover_file
+        if not cover_path:
+            return
+        key = (str(cover_path), self._cover_mtime)
+        if pixmap_cache.is_ready(key, need_pixmap=not self._options.compact):
+            return
+        if self._pending_cover is None:
+            pixmap_cache.cover_signals().loaded.connect(self._on_cover_loaded)
+        self._pending_cover = key
+        pixmap_cache.request_cover(key)
+
+    @pyqtSlot(object)
+    def _on_cover_loaded(self, key: tuple[str, int]) -> None:
+        if key != self._pending_cover:
+            return
+        self._cancel_pending_cover()
+        self.update()
+
+    def _cancel_pending_cover(self) -> None:
+        if self._pending_cover is None:
+            return
+        self._pending_cover = None
+        try:
+            pixmap_cache.cover_signals().loaded.disconnect(self._on_cover_loaded)
+        except TypeError:
+            pass
+
     @classmethod
-    def _get_scaled_cover_pixmap(cls, path: Path, w: int, h: int) -> QPixmap | None:
-        mtime = cls._get_cover_mtime(path)
-        key = (str(path), mtime, int(w), int(h))
-        cached = cls._bg_pixmap_cache.get(key)
-        if cached is not None and not cached.isNull():
+    def _get_clip_path(cls, w: int, h: int) -> QPainterPath:
+        """卡片圆角裁剪路径，按尺寸缓存复用"""
+        key = (int(w), int(h))
+        cached = cls._cache_get(cls._clip_path_cache, key)
+        if cached is not None:
             return cached
 
-        pix = QPixmap(str(path))
-        if pix.isNull():
-            return None
-
-        scaled = pix.scaled(
-            int(w),
-            int(h),
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        cls._cache_put(cls._bg_pixmap_cache, key, scaled, limit=160)
-        return scaled
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, key[0], key[1]), 12.0, 12.0)
+        cls._cache_put(cls._clip_path_cache, key, path, limit=16)
+        return path
 
     @classmethod
-    def _get_cover_avg_color(cls, path: Path) -> QColor:
-        mtime = cls._get_cover_mtime(path)
-        key = (str(path), mtime)
-        cached = cls._bg_color_cache.get(key)
+    def _get_overlay(cls, w: int, h: int) -> QPixmap:
+        """封面上的磨砂白 + 横向渐变遮罩，按尺寸缓存为一张 QPixmap"""
+        key = (int(w), int(h))
+        cached = cls._cache_get(cls._overlay_cache, key)
         if cached is not None:
             return cached
 
-        pix = QPixmap(str(path))
-        if pix.isNull():
-            c = QColor(COLORS["primary_light"])
-            cls._cache_put(cls._bg_color_cache, key, c, limit=240)
-            return c
-
-        img = pix.toImage()
-        if img.isNull():
-            c = QColor(COLORS["primary_light"])
-            cls._cache_put(cls._bg_color_cache, key, c, limit=240)
-            return c
+        overlay = QPixmap(key[0], key[1])
+        overlay.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(overlay)
+        painter.fillRect(overlay.rect(), cls._FROSTED)
+        grad = QLinearGradient(0, 0, key[0], 0)
+        for pos, color in cls._GRAD_STOPS:
+            grad.setColorAt(pos, color)
+        painter.fillRect(overlay.rect(), grad)
+        painter.end()
 
-        small = img.scaled(1, 1, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        c = small.pixelColor(0, 0)
-        cls._cache_put(cls._bg_color_cache, key, c, limit=240)
-        return c
+        cls._cache_put(cls._overlay_cache, key, overlay, limit=16)
+        return overlay
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
@@ -179,23 +376,27 @@ class ProjectCard(ShadowCard):
         radius = 12.0
         r = QRectF(self.rect())
 
-        clip = QPainterPath()
-        clip.addRoundedRect(r, radius, radius)
-        painter.setClipPath(clip)
-
-        card_color = QColor(COLORS["card"])
+        card_color = self._CARD_COLOR
         # 如果是特殊项目，使用淡紫色背景
         is_special = getattr(self._entry.project, 'is_special', False)
         if is_special:
-            card_color = QColor("#F3E5F5")
-            
-        painter.fillPath(clip, card_color)
+            card_color = self._SPECIAL_COLOR
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(card_color)
+        painter.drawRoundedRect(r, radius, radius)
 
-        cover_path = self._cover_path()
-        if cover_path:
+        cover_path = self._cover_file
+        if cover_path and self._pending_cover is None:
+            key = (str(cover_path), self._cover_mtime)
             if self._options.compact:
+                painter.setClipPath(self._get_clip_path(int(r.width()), int(r.height())))
                 strip_w = 10
-                c = self._get_cover_avg_color(cover_path)
+                c = pixmap_cache.cover_color(key)
+                if c is None:
+                    # 已被 LRU 淘汰：先用默认色，后台重新取
+                    c = QColor(COLORS["primary_light"])
+                    self._prewarm_cover()
                 grad = QLinearGradient(0, 0, 0, r.height())
                 top = QColor(c)
                 top.setAlpha(230)
@@ -205,20 +406,18 @@ class ProjectCard(ShadowCard):
                 grad.setColorAt(1.0, bottom)
                 painter.fillRect(0, 0, strip_w, int(r.height()), grad)
             else:
-                scaled = self._get_scaled_cover_pixmap(cover_path, int(r.width()), int(r.height()))
-                if scaled is not None and not scaled.isNull():
-                    x = int((r.width() - scaled.width()) / 2)
-                    y = int((r.height() - scaled.height()) / 2)
-                    painter.drawPixmap(x, y, scaled)
-
-                    frosted = QColor(255, 255, 255, 135)
-                    painter.fillRect(self.rect(), frosted)
-
-                    grad = QLinearGradient(r.left(), r.top(), r.right(), r.top())
-                    grad.setColorAt(0.0, QColor(255, 255, 255, 200))
-                    grad.setColorAt(0.55, QColor(255, 255, 255, 110))
-                    grad.setColorAt(1.0, QColor(255, 255, 255, 10))
-                    painter.fillRect(self.rect(), grad)
+                pix = pixmap_cache.cover_pixmap(key)
+                if pix is None:
+                    # 已被 QPixmapCache 淘汰：本帧不画封面，后台重新解码后再刷新
+                    self._prewarm_cover()
+                else:
+                    # 封面 + 遮罩按卡片尺寸预先合成圆角成品并缓存，这里只贴图
+                    w, h = int(r.width()), int(r.height())
+                    composed = pixmap_cache.rounded_pixmap(
+                        pix, w, h, radius, self.devicePixelRatioF(),
+                        pixmap_cache.pixmap_key(key), self._get_overlay(w, h),
+                    )
+                    painter.drawPixmap(0, 0, composed)
 
         painter.setClipping(False)
 
@@ -240,7 +439,7 @@ class ProjectCard(ShadowCard):
                 super().mousePressEvent(event)
                 return
 
-            if self._cover_path():
+            if self._cover_file:
                 if self._cover_preview_timer is None:
                     self._cover_preview_timer = QTimer(self)
                     self._cover_preview_timer.setSingleShot(True)
@@ -262,11 +461,74 @@ class ProjectCard(ShadowCard):
         checked = (state == 2) # Qt.CheckState.Checked
         self.checkToggled.emit(self._entry.project.id, checked)
 
-    def _build(self) -> None:
-        if self._options.compact:
-            self._build_compact()
-        else:
-            self._build_grid()
+    def set_pinned(self, pinned: bool) -> None:
+        """只更新置顶按钮的文字与样式，不重建卡片"""
+        btn = self._pin_btn
+        if btn.isChecked() != pinned:
+            btn.blockSignals(True)
+            btn.setChecked(pinned)
+            btn.blockSignals(False)
+        btn.setText("★" if pinned else "☆")
+        prefix = "compact_" if self._options.compact else ""
+        btn.setStyleSheet(_STYLES[f"{prefix}pin_on" if pinned else f"{prefix}pin_off"])
+
+    def _on_pin_toggled(self, pinned: bool) -> None:
+        self.set_pinned(pinned)
+        self.pinToggled.emit(self._entry.project.id, pinned)
+
+    # 按钮统一连到这几个槽，发射时取当前条目（卡片复用后也正确），不再为每个按钮建闭包
+    @pyqtSlot()
+    def _emit_open(self) -> None:
+        self.openRequested.emit(self._entry)
+
+    @pyqtSlot()
+    def _emit_manage(self) -> None:
+        self.manageRequested.emit(self._entry)
+
+    @pyqtSlot()
+    def _emit_note(self) -> None:
+        self.noteRequested.emit(self._entry)
+
+    @pyqtSlot()
+    def _emit_delete(self) -> None:
+        self.deleteRequested.emit(self._entry)
+
+    @property
+    def entry(self) -> ProjectEntry:
+        return self._entry
+
+    def update_entry(self, entry: ProjectEntry) -> None:
+        """复用卡片显示新数据：只有置顶变化时改按钮，项目字段变化时就地重建内容"""
+        old = self._entry
+        self._entry = entry
+
+        if old.project != entry.project or old.project_dir != entry.project_dir:
+            self._rebuild_contents()
+        elif old.pinned != entry.pinned:
+            self.set_pinned(entry.pinned)
+
+        cover_file = self._cover_path()
+        cover_mtime = self._get_cover_mtime(cover_file) if cover_file else 0
+        if (cover_file, cover_mtime) != (self._cover_file, self._cover_mtime):
+            self._cover_file = cover_file
+            self._cover_mtime = cover_mtime
+            self._cancel_pending_cover()
+            self._prewarm_cover()
+            self.update()
+
+    def _rebuild_contents(self) -> None:
+        checked = self.isChecked()
+        for child in self.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly):
+            if child is self._cover_popup:
+                continue
+            child.hide()
+            child.deleteLater()
+        # 旧布局转交给临时控件，随其一并销毁
+        QWidget().setLayout(self.layout())
+        self._options = replace(self._options, checked=checked)
+        self.setStyleSheet(_STYLES["card"])
+        build = self._build_compact if self._options.compact else self._build_grid
+        build()
 
     def _build_grid(self):
         layout = QVBoxLayout(self)
@@ -276,17 +538,7 @@ class ProjectCard(ShadowCard):
         # 特殊项目背景颜色
         is_special = getattr(self._entry.project, 'is_special', False)
         if is_special:
-            self.setStyleSheet(f"""
-                ProjectCard {{
-                    background-color: #F3E5F5;
-                    border-radius: 12px;
-                    border: 1px solid #CE93D8;
-                }}
-                ProjectCard:hover {{
-                    border: 1px solid #AB47BC;
-                    background-color: #E1BEE7;
-                }}
-            """)
+            self.setStyleSheet(_STYLES["card_special"])
         
         # 顶部：图标和编号
         top_layout = QHBoxLayout()
@@ -299,24 +551,7 @@ class ProjectCard(ShadowCard):
             top_layout.addSpacing(8)
 
         # 渐变背景图标
-        icon_container = QWidget()
-        icon_container.setFixedSize(48, 48)
-        icon_container.setStyleSheet(f"""
-            QWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {COLORS['primary_light']},
-                    stop:1 {COLORS['primary']});
-                border-radius: 12px;
-            }}
-        """)
-        icon_layout = QVBoxLayout(icon_container)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        icon = IconWidget(FI.FOLDER)
-        icon.setFixedSize(24, 24)
-        icon.setStyleSheet("color: white;")
-        icon_layout.addWidget(icon, alignment=Qt.AlignmentFlag.AlignCenter)
-        
-        top_layout.addWidget(icon_container)
+        top_layout.addWidget(_FolderBadge())
         
         # 编号与客户
         meta_layout = QVBoxLayout()
@@ -324,19 +559,19 @@ class ProjectCard(ShadowCard):
         
         code_label = QLabel(self._entry.project.id)
         code_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-        code_label.setStyleSheet(f"color: {COLORS['primary']}; font-size: 11px; font-weight: bold;")
+        code_label.setStyleSheet(_STYLES["code_label"])
         meta_layout.addWidget(code_label)
         
         cust_text = self._entry.project.customer or "无客户"
         cust_label = QLabel(cust_text)
         cust_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-        cust_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 12px;")
+        cust_label.setStyleSheet(_STYLES["cust_label"])
         meta_layout.addWidget(cust_label)
         
         if getattr(self._entry.project, 'is_special', False):
              special_label = QLabel("特殊项目")
              special_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-             special_label.setStyleSheet(f"color: #9C27B0; font-size: 11px; font-weight: bold;")
+             special_label.setStyleSheet(_STYLES["special_label"])
              meta_layout.addWidget(special_label)
         
         top_layout.addLayout(meta_layout)
@@ -347,60 +582,35 @@ class ProjectCard(ShadowCard):
         pin_btn.setFixedSize(28, 28)
         pin_btn.setCheckable(True)
         pin_btn.setChecked(self._entry.pinned)
-        pin_btn.setStyleSheet(f"""
-            QPushButton {{
-                border: none;
-                color: {COLORS['warning'] if self._entry.pinned else COLORS['text_muted']};
-                font-size: 16px;
-                background: transparent;
-            }}
-            QPushButton:hover {{ background: {COLORS['bg']}; border-radius: 4px; }}
-        """)
-        pin_btn.toggled.connect(lambda v: self.pinToggled.emit(self._entry.project.id, v))
+        pin_btn.setStyleSheet(_STYLES["pin_on" if self._entry.pinned else "pin_off"])
+        pin_btn.toggled.connect(self._on_pin_toggled)
         top_layout.addWidget(pin_btn)
+        self._pin_btn = pin_btn
 
         manage_btn = QPushButton()
-        manage_btn.setIcon(FI.EDIT.icon())
+        manage_btn.setIcon(_fi_icon(FI.EDIT))
         manage_btn.setFixedSize(28, 28)
         manage_btn.setToolTip("管理项目")
-        manage_btn.setStyleSheet(f"""
-            QPushButton {{
-                border: none;
-                background: transparent;
-            }}
-            QPushButton:hover {{ background: {COLORS['bg']}; border-radius: 4px; }}
-        """)
-        manage_btn.clicked.connect(lambda: self.manageRequested.emit(self._entry))
+        manage_btn.setStyleSheet(_STYLES["icon_btn"])
+        manage_btn.clicked.connect(self._emit_manage)
         top_layout.addWidget(manage_btn)
 
         # Note Button
         note_btn = QPushButton()
-        note_btn.setIcon(FI.CHAT.icon())
+        note_btn.setIcon(_fi_icon(FI.CHAT))
         note_btn.setFixedSize(28, 28)
         note_btn.setToolTip("项目留言")
-        note_btn.setStyleSheet(f"""
-            QPushButton {{
-                border: none;
-                background: transparent;
-            }}
-            QPushButton:hover {{ background: {COLORS['bg']}; border-radius: 4px; }}
-        """)
-        note_btn.clicked.connect(lambda: self.noteRequested.emit(self._entry))
+        note_btn.setStyleSheet(_STYLES["icon_btn"])
+        note_btn.clicked.connect(self._emit_note)
         top_layout.addWidget(note_btn)
         
         # 删除按钮
         del_btn = QPushButton()
-        del_btn.setIcon(FI.DELETE.icon())
+        del_btn.setIcon(_fi_icon(FI.DELETE))
         del_btn.setFixedSize(28, 28)
         del_btn.setToolTip("删除项目")
-        del_btn.setStyleSheet(f"""
-            QPushButton {{
-                border: none;
-                background: transparent;
-            }}
-            QPushButton:hover {{ background: #fee2e2; border-radius: 4px; }}
-        """)
-        del_btn.clicked.connect(lambda: self.deleteRequested.emit(self._entry))
+        del_btn.setStyleSheet(_STYLES["del_btn"])
+        del_btn.clicked.connect(self._emit_delete)
         top_layout.addWidget(del_btn)
         
         layout.addLayout(top_layout)
@@ -412,7 +622,7 @@ class ProjectCard(ShadowCard):
         name_label.setFont(name_font)
         name_label.setWordWrap(False)
         name_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
-        name_label.setStyleSheet(f"color: {COLORS['text']};")
+        name_label.setStyleSheet(_STYLES["name_label"])
         layout.addWidget(name_label)
 
         # 料号（单击复制，橙色，小一号）
@@ -422,24 +632,12 @@ class ProjectCard(ShadowCard):
             part_label.setFont(part_font)
             part_label.setWordWrap(False)
             part_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-            part_label.setStyleSheet(f"color: {COLORS['primary']};")
+            part_label.setStyleSheet(_STYLES["part_label"])
             layout.addWidget(part_label)
         
         # 标签
-        tags_layout = QHBoxLayout()
-        tags_layout.setSpacing(6)
-        for tag in self._entry.project.tags[:3]:
-            lbl = QLabel(f"#{tag}")
-            lbl.setStyleSheet(f"""
-                background: {COLORS['bg']}; 
-                color: {COLORS['text_muted']};
-                border-radius: 4px;
-                padding: 2px 6px;
-                font-size: 11px;
-            """)
-            tags_layout.addWidget(lbl)
-        tags_layout.addStretch()
-        layout.addLayout(tags_layout)
+        if self._entry.project.tags:
+            layout.addWidget(_TagStrip(self._entry.project.tags[:3], pad_x=6, spacing=6), alignment=Qt.AlignmentFlag.AlignLeft)
         
         layout.addStretch()
         
@@ -448,7 +646,7 @@ class ProjectCard(ShadowCard):
         dt = self._entry.project.create_time.strftime("%Y-%m-%d")
         date_label = QLabel(dt)
         date_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-        date_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
+        date_label.setStyleSheet(_STYLES["date_label"])
         bottom_layout.addWidget(date_label)
         
         bottom_layout.addStretch()
@@ -456,22 +654,8 @@ class ProjectCard(ShadowCard):
         open_btn = QPushButton("打开")
         open_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         open_btn.setFixedHeight(26)
-        open_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 13px;
-                padding: 0 12px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['primary']};
-                color: white;
-                border: 1px solid {COLORS['primary']};
-            }}
-        """)
-        open_btn.clicked.connect(lambda: self.openRequested.emit(self._entry))
+        open_btn.setStyleSheet(_STYLES["open_btn_grid"])
+        open_btn.clicked.connect(self._emit_open)
         bottom_layout.addWidget(open_btn)
         
         layout.addLayout(bottom_layout)
@@ -484,17 +668,7 @@ class ProjectCard(ShadowCard):
         # 特殊项目背景颜色
         is_special = getattr(self._entry.project, 'is_special', False)
         if is_special:
-            self.setStyleSheet(f"""
-                ProjectCard {{
-                    background-color: #F3E5F5;
-                    border-radius: 12px;
-                    border: 1px solid #CE93D8;
-                }}
-                ProjectCard:hover {{
-                    border: 1px solid #AB47BC;
-                    background-color: #E1BEE7;
-                }}
-            """)
+            self.setStyleSheet(_STYLES["card_special"])
         
         if self._options.checkable:
             self._checkbox = CheckBox(parent=self)
@@ -502,9 +676,9 @@ class ProjectCard(ShadowCard):
             self._checkbox.stateChanged.connect(self._on_checked_changed)
             layout.addWidget(self._checkbox)
 
-        icon = IconWidget(FI.FOLDER)
+        icon = IconWidget(_fi_icon(FI.FOLDER))
         icon.setFixedSize(20, 20)
-        icon.setStyleSheet(f"color: {COLORS['primary']};")
+        icon.setStyleSheet(_STYLES["compact_icon"])
         layout.addWidget(icon)
         
         # 信息列
@@ -514,14 +688,14 @@ class ProjectCard(ShadowCard):
         name_label = _CopyLabel(self._entry.project.name)
         name_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
         name_label.setWordWrap(False)
-        name_label.setStyleSheet(f"font-weight: bold; font-size: 13px; color: {COLORS['text']};")
+        name_label.setStyleSheet(_STYLES["compact_name"])
         info_layout.addWidget(name_label)
 
         if self._entry.project.part_number:
             part_label = _CopyLabel(self._entry.project.part_number)
             part_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
             part_label.setWordWrap(False)
-            part_label.setStyleSheet(f"font-weight: bold; font-size: 12px; color: {COLORS['primary']};")
+            part_label.setStyleSheet(_STYLES["compact_part"])
             info_layout.addWidget(part_label)
         
         meta = f"{self._entry.project.id} · {self._entry.project.customer or '无客户'}"
@@ -529,17 +703,15 @@ class ProjectCard(ShadowCard):
             meta += " · 特殊"
         meta_label = QLabel(meta)
         meta_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-        meta_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
+        meta_label.setStyleSheet(_STYLES["compact_meta"])
         info_layout.addWidget(meta_label)
         
         layout.addLayout(info_layout, 1)
         
         # 标签
-        for tag in self._entry.project.tags[:2]:
-            lbl = QLabel(f"#{tag}")
-            lbl.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px; background: {COLORS['bg']}; padding: 2px 4px; border-radius: 4px;")
-            layout.addWidget(lbl)
-            
+        if self._entry.project.tags:
+            layout.addWidget(_TagStrip(self._entry.project.tags[:2], pad_x=4, spacing=16))
+
         # 按钮组
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(4)
@@ -548,30 +720,22 @@ class ProjectCard(ShadowCard):
         pin_btn.setFixedSize(24, 24)
         pin_btn.setCheckable(True)
         pin_btn.setChecked(self._entry.pinned)
-        pin_btn.setStyleSheet(f"border: none; color: {COLORS['warning'] if self._entry.pinned else COLORS['text_muted']}; background: transparent;")
-        pin_btn.toggled.connect(lambda v: self.pinToggled.emit(self._entry.project.id, v))
+        pin_btn.setStyleSheet(_STYLES["compact_pin_on" if self._entry.pinned else "compact_pin_off"])
+        pin_btn.toggled.connect(self._on_pin_toggled)
         btn_layout.addWidget(pin_btn)
+        self._pin_btn = pin_btn
         
         manage_btn = QPushButton()
-        manage_btn.setIcon(FI.EDIT.icon())
+        manage_btn.setIcon(_fi_icon(FI.EDIT))
         manage_btn.setFixedSize(24, 24)
-        manage_btn.setStyleSheet("border: none; background: transparent;")
-        manage_btn.clicked.connect(lambda: self.manageRequested.emit(self._entry))
+        manage_btn.setStyleSheet(_STYLES["compact_icon_btn"])
+        manage_btn.clicked.connect(self._emit_manage)
         btn_layout.addWidget(manage_btn)
         
         open_btn = QPushButton("打开")
         open_btn.setFixedHeight(24)
-        open_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                padding: 0 8px;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{ background-color: {COLORS['border']}; }}
-        """)
-        open_btn.clicked.connect(lambda: self.openRequested.emit(self._entry))
+        open_btn.setStyleSheet(_STYLES["open_btn_compact"])
+        open_btn.clicked.connect(self._emit_open)
         btn_layout.addWidget(open_btn)
         
         layout.addLayout(btn_layout)
@@ -648,14 +812,29 @@ class _CopyLabel(QLabel):
         super().mousePressEvent(event)
 
 
+def _load_viewer_pixmap(path: str, mtime: int) -> QPixmap:
+    """大图查看器的原图，同一封面多次打开共用一次解码；放在 QPixmapCache 里，受全局上限约束"""
+    key = f"viewer|{path}|{mtime}"
+    pix = QPixmapCache.find(key)
+    if pix is None or pix.isNull():
+        pix = QPixmap(path)
+        if not pix.isNull():
+            QPixmapCache.insert(key, pix)
+    return pix
+
+
 class _CoverViewerDialog(QDialog):
     def __init__(self, image_path: str, title: str, parent: QWidget | None = None):
         super().__init__(parent)
+        # 拖拽缩放时先快速缩放预览，停止 80ms 后再做一次平滑缩放
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._refresh)
         self.setWindowTitle(title)
         self.resize(980, 680)
         self.setStyleSheet(f"background: {COLORS['card']};")
 
-        self._pix = QPixmap(image_path)
+        self._pix = self._load_cached(image_path)
         self._label = QLabel()
         self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -676,7 +855,15 @@ class _CoverViewerDialog(QDialog):
 
         self._refresh()
 
-    def _refresh(self) -> None:
+    @classmethod
+    def _load_cached(cls, path: str) -> QPixmap:
+        try:
+            mtime = int(Path(path).stat().st_mtime)
+        except Exception:
+            mtime = 0
+        return _load_viewer_pixmap(path, mtime)
+
+    def _refresh(self, smooth: bool = True) -> None:
         if self._pix.isNull():
             self._label.setText("无法加载图片")
             self._label.setPixmap(QPixmap())
@@ -684,13 +871,15 @@ class _CoverViewerDialog(QDialog):
         viewport = self._scroll.viewport().size()
         w = max(1, viewport.width() - 32)
         h = max(1, viewport.height() - 32)
-        scaled = self._pix.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        mode = Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+        scaled = self._pix.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, mode)
         self._label.setText("")
         self._label.setPixmap(scaled)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self._refresh()
+        self._refresh(smooth=False)
+        self._refresh_timer.start(80)
 
 
 class _CoverViewerPopup(_CoverViewerDialog):
@@ -701,7 +890,6 @@ class _CoverViewerPopup(_CoverViewerDialog):
             f"background: {COLORS['card']}; border: 1px solid {COLORS['border']}; border-radius: 12px;"
         )
         self.resize(900, 620)
-        self._refresh()
 
     def mousePressEvent(self, event) -> None:
         self.close()
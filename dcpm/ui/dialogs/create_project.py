@@ -1,9 +1,13 @@
+import re
 from datetime import datetime
 from qfluentwidgets import (
     SubtitleLabel, StrongBodyLabel, LineEdit, MessageBoxBase, CheckBox
 )
 from dcpm.services.project_service import CreateProjectRequest
 
+# 标签分隔符：半角/全角逗号、顿号，连同两侧空白一起切掉
+_TAG_SPLIT = re.compile(r"\s*[,，、]\s*")
+
 class CreateProjectDialog(MessageBoxBase):
     """Fluent 风格的新建项目对话框"""
     def __init__(self, parent=None):
@@ -73,22 +77,43 @@ class CreateProjectDialog(MessageBoxBase):
         
         # 简单的验证逻辑
         self.widget.setMinimumWidth(360)
+        # 各字段是否有效分别缓存，按键时只检查当前字段，状态翻转时才改按钮
+        self._name_ok = False
+        self._month_ok = self._has_text(self.monthEdit.text())
+        self._valid = False
         self.yesButton.setDisabled(True)
-        self.custEdit.textChanged.connect(self._validate)
-        self.nameEdit.textChanged.connect(self._validate)
-        self.monthEdit.textChanged.connect(self._validate)
+        self.nameEdit.textChanged.connect(self._on_name_changed)
+        self.monthEdit.textChanged.connect(self._on_month_changed)
+
+    @staticmethod
+    def _has_text(text: str) -> bool:
+        # 非空且不全是空白；不做 strip，按键时不产生新字符串
+        return bool(text) and not text.isspace()
+
+    def _on_name_changed(self, text: str):
+        ok = self._has_text(text)
+        if ok != self._name_ok:
+            self._name_ok = ok
+            self._validate()
+
+    def _on_month_changed(self, text: str):
+        ok = self._has_text(text)
+        if ok != self._month_ok:
+            self._month_ok = ok
+            self._validate()
 
     def _validate(self):
-        valid = bool(self.nameEdit.text().strip() and 
-                     self.monthEdit.text().strip())
-        self.yesButton.setDisabled(not valid)
+        valid = self._name_ok and self._month_ok
+        if valid != self._valid:
+            self._valid = valid
+            self.yesButton.setDisabled(not valid)
 
     def build_request(self):
         return CreateProjectRequest(
             month=self.monthEdit.text(),
             customer=self.custEdit.text().strip() or None,
             name=self.nameEdit.text(),
-            tags=self.tagsEdit.text().split(","),
+            tags=[t for t in _TAG_SPLIT.split(self.tagsEdit.text().strip()) if t],
             part_number=self.pnEdit.text(),
             material=self.materialEdit.text(),
             is_special=self.specialCheckBox.isChecked()
@@ -1,14 +1,123 @@
+import functools
+import os
+import re
 from pathlib import Path
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF
-from PyQt6.QtGui import QPainter, QPainterPath, QPixmap
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QFileDialog
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QRectF, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QPainter, QPixmap, QImage, QImageReader, QPixmapCache
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QWidget, QLabel, QFileDialog, QSpacerItem, QSizePolicy,
+)
 from qfluentwidgets import (
     SubtitleLabel, LineEdit, StrongBodyLabel, ComboBox, SwitchButton, 
     PushButton, PrimaryPushButton, TextEdit
 )
 
 from dcpm.services.library_service import ProjectEntry
-from dcpm.ui.theme.colors import COLORS
+from dcpm.services.project_service import cover_preview_path
+from dcpm.ui.components import pixmap_cache
+from dcpm.ui.theme.colors import COLORS, DESTRUCTIVE_SECONDARY_QSS
+
+# 标签分隔符：半角/全角逗号、顿号，连同两侧空白一起切掉（与新建项目对话框一致）
+_TAG_SPLIT = re.compile(r"\s*[,，、]\s*")
+
+# 对话框样式表与实例无关，导入时生成一次；封面区域按 objectName 选择，整个对话框只设置一次样式表
+_DIALOG_QSS = f"""
+    * {{ background: {COLORS['card']}; }}
+    QWidget#coverContainer {{ background: {COLORS['bg']}; border-radius: 8px; border: 1px solid {COLORS['border']}; }}
+    QLabel#coverPreview {{ background: {COLORS['border']}; border-radius: 6px; color: {COLORS['text_muted']}; }}
+"""
+
+
+@functools.lru_cache(maxsize=8)
+def _rounded_mask(w: int, h: int, radius: int, dpr: float) -> QImage:
+    """封面圆角遮罩，尺寸固定（160x90x6），构造一次后以 DestinationIn 合成复用"""
+    mask = QImage(int(w * dpr), int(h * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+    mask.setDevicePixelRatio(dpr)
+    mask.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(Qt.GlobalColor.white)
+    painter.drawRoundedRect(QRectF(0, 0, w, h), radius, radius)
+    painter.end()
+    return mask
+
+
+class _CoverPreviewSignals(QObject):
+    decoded = pyqtSignal(int, QImage)  # job token, image
+
+
+class _CoverPreviewRunnable(QRunnable):
+    """在线程池中解码封面并缩放到预览尺寸（QImage 可在非 GUI 线程使用）"""
+
+    def __init__(
+        self,
+        token: int,
+        path: str,
+        w: int,
+        h: int,
+        signals: _CoverPreviewSignals,
+        thumb_path: Path | None = None,
+    ):
+        super().__init__()
+        self._token = token
+        self._path = path
+        self._w = w
+        self._h = h
+        self._signals = signals
+        self._thumb_path = thumb_path
+
+    def run(self) -> None:
+        img = self._read_thumb()
+        if img is None:
+            img = self._decode()
+            if not img.isNull() and self._thumb_path is not None:
+                try:
+                    self._thumb_path.parent.mkdir(parents=True, exist_ok=True)
+                    img.save(str(self._thumb_path), "PNG")
+                except OSError:
+                    pass
+        try:
+            self._signals.decoded.emit(self._token, img)
+        except RuntimeError:
+            pass
+
+    def _read_thumb(self) -> QImage | None:
+        """磁盘上的缩略图不旧于封面时直接读它（几 KB 的 PNG），跳过原图解码"""
+        if self._thumb_path is None:
+            return None
+        try:
+            if self._thumb_path.stat().st_mtime < os.path.getmtime(self._path):
+                return None
+        except OSError:
+            return None
+        img = QImage(str(self._thumb_path))
+        if img.isNull():
+            return None
+        img.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+        return img
+
+    def _decode(self) -> QImage:
+        # 直接按目标尺寸解码（JPEG 可走 DCT 缩放），不再先解出整张原图
+        reader = QImageReader(self._path)
+        reader.setDecideFormatFromContent(True)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(self._w, self._h, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+        img = reader.read()
+        if not img.isNull() and not size.isValid():
+            img = img.scaled(
+                self._w,
+                self._h,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        if not img.isNull():
+            # 原地转成预乘格式，fromImage 与后续合成都不必再隐式转换一次
+            img.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+        return img
+
 
 class ManageProjectDialog(QDialog):
     deleteRequested = pyqtSignal()
@@ -17,7 +126,7 @@ class ManageProjectDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("管理项目")
         self.setFixedSize(550, 720) 
-        self.setStyleSheet(f"background: {COLORS['card']};")
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
@@ -27,11 +136,19 @@ class ManageProjectDialog(QDialog):
         layout.addWidget(SubtitleLabel("项目详情", self))
         layout.addSpacing(4)
 
+        # 各字段放在同一个表单布局中，标题在上、控件在下
+        form = QFormLayout()
+        form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
+        form.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.setVerticalSpacing(8)
+        layout.addLayout(form)
+
         # 1. Name
         self._name_edit = LineEdit(self)
-        self._name_edit.setText(entry.project.name)
         self._name_edit.setPlaceholderText("项目名称")
-        self._add_field(layout, "项目名称", self._name_edit)
+        self._add_field(form, "项目名称", self._name_edit)
 
         # 1.5 Part Number & Material
         row1_5 = QHBoxLayout()
@@ -39,7 +156,6 @@ class ManageProjectDialog(QDialog):
 
         # Part Number
         self._part_number_edit = LineEdit(self)
-        self._part_number_edit.setText(entry.project.part_number or "")
         self._part_number_edit.setPlaceholderText("料号")
         
         pn_layout = QVBoxLayout()
@@ -50,7 +166,6 @@ class ManageProjectDialog(QDialog):
 
         # Material
         self._material_edit = LineEdit(self)
-        self._material_edit.setText(entry.project.material or "")
         self._material_edit.setPlaceholderText("材料")
         
         mat_layout = QVBoxLayout()
@@ -59,7 +174,7 @@ class ManageProjectDialog(QDialog):
         mat_layout.addWidget(self._material_edit)
         row1_5.addLayout(mat_layout)
 
-        layout.addLayout(row1_5)
+        self._add_field(form, None, row1_5)
 
         # 2. Status & Pinned (Row)
         row2 = QHBoxLayout()
@@ -68,7 +183,6 @@ class ManageProjectDialog(QDialog):
         # Status
         self._status_combo = ComboBox(self)
         self._status_combo.addItems(["ongoing", "delivered", "archived"])
-        self._status_combo.setCurrentText(entry.project.status)
         self._status_combo.setFixedWidth(200)
         
         status_layout = QVBoxLayout()
@@ -79,12 +193,10 @@ class ManageProjectDialog(QDialog):
         
         # Pinned
         self._pinned_switch = SwitchButton(self)
-        self._pinned_switch.setChecked(entry.pinned)
         self._pinned_switch.setText("置顶显示")
         
         # Special
         self._special_switch = SwitchButton(self)
-        self._special_switch.setChecked(getattr(entry.project, 'is_special', False))
         self._special_switch.setText("特殊项目")
         self._special_switch.setToolTip("特殊项目不参与探伤报告和共享盘文件夹的自动索引")
         
@@ -96,19 +208,18 @@ class ManageProjectDialog(QDialog):
         row2.addLayout(pinned_layout)
         
         row2.addStretch()
-        layout.addLayout(row2)
+        self._add_field(form, None, row2)
 
         # 3. Cover
         cover_container = QWidget()
         cover_container.setObjectName("coverContainer")
-        cover_container.setStyleSheet(f"#coverContainer {{ background: {COLORS['bg']}; border-radius: 8px; border: 1px solid {COLORS['border']}; }}")
         cover_h = QHBoxLayout(cover_container)
         cover_h.setContentsMargins(16, 16, 16, 16)
         
         self._cover_preview = QLabel("无封面")
         self._cover_preview.setFixedSize(160, 90)
         self._cover_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._cover_preview.setStyleSheet(f"background: {COLORS['border']}; border-radius: 6px; color: {COLORS['text_muted']}")
+        self._cover_preview.setObjectName("coverPreview")
         
         btn_v = QVBoxLayout()
         btn_v.setSpacing(8)
@@ -127,20 +238,18 @@ class ManageProjectDialog(QDialog):
         cover_h.addLayout(btn_v)
         cover_h.addStretch()
         
-        self._add_field(layout, "封面图片", cover_container)
+        self._add_field(form, "封面图片", cover_container)
 
         # 4. Tags
         self._tags_edit = LineEdit(self)
-        self._tags_edit.setText(",".join(entry.project.tags))
         self._tags_edit.setPlaceholderText("标签用逗号分隔")
-        self._add_field(layout, "标签", self._tags_edit)
+        self._add_field(form, "标签", self._tags_edit)
 
         # 5. Description
         self._desc_edit = TextEdit(self)
-        self._desc_edit.setPlainText(entry.project.description or "")
         self._desc_edit.setPlaceholderText("项目备注...")
         self._desc_edit.setFixedHeight(100)
-        self._add_field(layout, "备注", self._desc_edit)
+        self._add_field(form, "备注", self._desc_edit)
 
         layout.addStretch()
 
@@ -148,17 +257,7 @@ class ManageProjectDialog(QDialog):
         btn_layout = QHBoxLayout()
         
         del_btn = PushButton("删除项目", self)
-        del_btn.setStyleSheet(f"""
-            QPushButton {{
-                color: {COLORS['error']}; 
-                border: 1px solid {COLORS['border']};
-                background: transparent;
-            }}
-            QPushButton:hover {{
-                background: #FEE2E2;
-                border: 1px solid #FECACA;
-            }}
-        """)
+        del_btn.setStyleSheet(DESTRUCTIVE_SECONDARY_QSS)
         del_btn.clicked.connect(self.deleteRequested.emit)
         
         cancel_btn = PushButton("取消", self)
@@ -177,45 +276,131 @@ class ManageProjectDialog(QDialog):
         # Init state
         self._cover_source_path: str | None = None
         self._cover_cleared = False
-        self._apply_existing_cover(entry)
+        # 每次请求封面预览递增，过期的解码结果直接丢弃
+        self._cover_job_token = 0
+        self._cover_cache_key = ""
+        self._cover_signals = _CoverPreviewSignals(self)
+        self._cover_signals.decoded.connect(self._on_cover_decoded)
+        self.load(entry)
 
-    def _add_field(self, layout, label_text, widget):
-        v = QVBoxLayout()
-        v.setSpacing(8)
-        v.addWidget(StrongBodyLabel(label_text, self))
-        v.addWidget(widget)
-        layout.addLayout(v)
+    def load(self, entry: ProjectEntry) -> None:
+        """用新项目重新填充各字段；对话框可缓存复用，不必每次重建控件"""
+        self._name_edit.setText(entry.project.name)
+        self._part_number_edit.setText(entry.project.part_number or "")
+        self._material_edit.setText(entry.project.material or "")
+        self._status_combo.setCurrentText(entry.project.status)
+        self._pinned_switch.setChecked(entry.pinned)
+        self._special_switch.setChecked(getattr(entry.project, 'is_special', False))
+        self._tags_edit.setText(",".join(entry.project.tags))
+        self._desc_edit.setPlainText(entry.project.description or "")
+
+        # 丢弃上一个项目的封面状态与未完成的解码
+        self._cover_job_token += 1
+        self._cover_source_path = None
+        self._cover_cleared = False
+        self._cover_preview.clear()
+        self._cover_preview.setProperty("coverKey", None)
+        self._cover_preview.setText("无封面")
+        # 封面在对话框显示时再加载，构造本身保持轻量
+        self._entry = entry
+        self._cover_loaded = False
+        if self.isVisible():
+            self._cover_loaded = True
+            self._apply_existing_cover(entry)
 
-    def _rounded_pixmap(self, pixmap: QPixmap, w: int, h: int, radius: int) -> QPixmap:
-        target = QPixmap(w, h)
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if not self._cover_loaded:
+            self._cover_loaded = True
+            self._apply_existing_cover(self._entry)
+
+    def _add_field(self, form: QFormLayout, label_text: str | None, field) -> None:
+        # 字段之间 20px：两侧各 8px 行距 + 4px 间隔行
+        if form.rowCount():
+            form.addItem(QSpacerItem(0, 4, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
+        if label_text is None:
+            form.addRow(field)
+        else:
+            form.addRow(StrongBodyLabel(label_text, self), field)
+
+    def _rounded_pixmap(self, image: QImage, w: int, h: int, radius: int) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        # 输入、缩放、圆角绘制全程在 QImage 上完成，最后只做一次 QPixmap.fromImage
+        target = QImage(int(w * dpr), int(h * dpr), QImage.Format.Format_ARGB32_Premultiplied)
+        target.setDevicePixelRatio(dpr)
         target.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(target)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        path = QPainterPath()
-        path.addRoundedRect(QRectF(0, 0, w, h), radius, radius)
-        painter.setClipPath(path)
-
-        scaled = pixmap.scaled(
-            w,
-            h,
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        x = int((w - scaled.width()) / 2)
-        y = int((h - scaled.height()) / 2)
-        painter.drawPixmap(x, y, scaled)
+
+        tw, th = int(w * dpr), int(h * dpr)
+        # 解码线程已按目标尺寸缩放过时，这里不再做第二次平滑缩放
+        if (image.width() == tw and image.height() >= th) or (image.height() == th and image.width() >= tw):
+            scaled = image
+        else:
+            scaled = image.scaled(
+                tw,
+                th,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        x = (w - scaled.width() / dpr) / 2
+        y = (h - scaled.height() / dpr) / 2
+        painter.drawImage(QRectF(x, y, scaled.width() / dpr, scaled.height() / dpr), scaled, QRectF(scaled.rect()))
+        # 用预先画好的圆角遮罩一次性裁掉四角，代替逐行的裁剪路径
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, _rounded_mask(w, h, radius, dpr))
         painter.end()
-        return target
+        return QPixmap.fromImage(target)
 
-    def _set_cover_preview_from_file(self, file_path: str) -> None:
-        pix = QPixmap(file_path)
-        if pix.isNull():
-            self._cover_preview.setPixmap(QPixmap())
+    def _set_cover_preview_from_file(self, file_path: str, project_dir: Path | None = None) -> None:
+        """project_dir 给出时（项目已有的封面）解码结果另存一份缩略图到项目的 .pm_cover 下"""
+        dpr = self.devicePixelRatioF()
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            mtime = 0
+        key = f"{os.path.abspath(file_path)}|{mtime}|160x90@{dpr:g}"
+        self._cover_job_token += 1
+        # 标签上已经是这张封面（路径与 mtime 均未变）时什么都不做
+        pix = self._cover_preview.pixmap()
+        if self._cover_preview.property("coverKey") == key and pix is not None and not pix.isNull():
+            return
+        # 同一封面反复打开时直接复用圆角成品，跳过解码与绘制
+        self._cover_cache_key = key
+        cached = QPixmapCache.find(self._cover_cache_key)
+        if cached is not None and not cached.isNull():
+            self._show_cover_pixmap(cached)
+            return
+        # 仪表盘卡片已解码过这张封面（同一 (路径, mtime) 键）时直接取来缩放，不再读盘
+        shared = pixmap_cache.cover_pixmap((file_path, int(mtime)))
+        if shared is not None:
+            pix = self._rounded_pixmap(shared.toImage(), 160, 90, 6)
+            QPixmapCache.insert(self._cover_cache_key, pix)
+            self._show_cover_pixmap(pix)
+            return
+        w, h = int(160 * dpr), int(90 * dpr)
+        thumb = cover_preview_path(project_dir, w, h) if project_dir is not None else None
+        QThreadPool.globalInstance().start(
+            _CoverPreviewRunnable(self._cover_job_token, file_path, w, h, self._cover_signals, thumb)
+        )
+
+    @pyqtSlot(int, QImage)
+    def _on_cover_decoded(self, token: int, img: QImage) -> None:
+        if token != self._cover_job_token:
+            return
+        if img.isNull():
+            self._cover_preview.clear()
+            self._cover_preview.setProperty("coverKey", None)
             self._cover_preview.setText("无法预览")
             return
+        pix = self._rounded_pixmap(img, 160, 90, 6)
+        QPixmapCache.insert(self._cover_cache_key, pix)
+        self._show_cover_pixmap(pix)
+
+    def _show_cover_pixmap(self, pix: QPixmap) -> None:
         self._cover_preview.setText("")
-        self._cover_preview.setPixmap(self._rounded_pixmap(pix, 160, 90, 6))
+        self._cover_preview.setPixmap(pix)
+        self._cover_preview.setProperty("coverKey", self._cover_cache_key)
 
     def _apply_existing_cover(self, entry: ProjectEntry) -> None:
         cover = entry.project.cover_image
@@ -225,7 +410,7 @@ class ManageProjectDialog(QDialog):
         if not p.is_absolute():
             p = Path(entry.project_dir) / p
         if p.exists() and p.is_file():
-            self._set_cover_preview_from_file(str(p))
+            self._set_cover_preview_from_file(str(p), Path(entry.project_dir))
 
     def _pick_cover(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -238,12 +423,16 @@ class ManageProjectDialog(QDialog):
             return
         self._cover_source_path = path
         self._cover_cleared = False
+        self._cover_loaded = True
         self._set_cover_preview_from_file(path)
 
     def _clear_cover(self) -> None:
+        self._cover_job_token += 1
+        self._cover_loaded = True
         self._cover_source_path = None
         self._cover_cleared = True
-        self._cover_preview.setPixmap(QPixmap())
+        self._cover_preview.clear()
+        self._cover_preview.setProperty("coverKey", None)
         self._cover_preview.setText("无封面")
     
     @property
@@ -259,7 +448,7 @@ class ManageProjectDialog(QDialog):
     @property
     def material(self): return self._material_edit.text().strip() or None
     @property
-    def tags_list(self): return self._tags_edit.text().split(",")
+    def tags_list(self): return [t for t in _TAG_SPLIT.split(self._tags_edit.text().strip()) if t]
     @property
     def description(self): return self._desc_edit.toPlainText()
     @property
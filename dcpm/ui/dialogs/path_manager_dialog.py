@@ -1,3 +1,5 @@
+import os
+
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QHBoxLayout, 
@@ -22,9 +24,14 @@ class PathManagerDialog(MessageBoxBase):
         self.listWidget.setMinimumHeight(200)
         self.listWidget.setMinimumWidth(400)
         
-        # 初始化列表
+        # 初始化列表（按规范化路径去重，Windows 下不区分大小写）
+        self._paths: list[str] = []
+        self._paths_set: set[str] = set()
         for path in paths:
-            self._add_path_item(path)
+            key = self._path_key(path)
+            if key not in self._paths_set:
+                self._paths_set.add(key)
+                self._add_path_item(path)
             
         # 按钮栏
         self.buttonLayout = QHBoxLayout()
@@ -45,16 +52,22 @@ class PathManagerDialog(MessageBoxBase):
         # 信号连接
         self.addButton.clicked.connect(self._add_folder)
         self.removeButton.clicked.connect(self._remove_selected)
+        self._has_selection = False
         self.listWidget.itemSelectionChanged.connect(self._update_button_state)
         
         self.yesButton.setText("保存")
         self.cancelButton.setText("取消")
         self.widget.setMinimumWidth(500)
 
+    @staticmethod
+    def _path_key(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path))
+
     def _add_path_item(self, path: str):
         item = QListWidgetItem(path)
         item.setToolTip(path)
         self.listWidget.addItem(item)
+        self._paths.append(path)
 
     def _add_folder(self):
         folder = QFileDialog.getExistingDirectory(
@@ -65,17 +78,22 @@ class PathManagerDialog(MessageBoxBase):
         
         if folder:
             # 检查是否重复
-            existing = [self.listWidget.item(i).text() for i in range(self.listWidget.count())]
-            if folder not in existing:
+            key = self._path_key(folder)
+            if key not in self._paths_set:
+                self._paths_set.add(key)
                 self._add_path_item(folder)
 
     def _remove_selected(self):
-        row = self.listWidget.currentRow()
-        if row >= 0:
-            self.listWidget.takeItem(row)
+        # 与按钮状态使用同一判据：删除选中的那一行
+        if not self._has_selection:
+            return
+        row = self.listWidget.row(self.listWidget.selectedItems()[0])
+        self._paths_set.discard(self._path_key(self._paths.pop(row)))
+        self.listWidget.takeItem(row)
 
     def _update_button_state(self):
-        self.removeButton.setEnabled(self.listWidget.count() > 0 and self.listWidget.currentRow() >= 0)
+        self._has_selection = bool(self.listWidget.selectedItems())
+        self.removeButton.setEnabled(self._has_selection)
 
     def get_paths(self) -> list[str]:
-        return [self.listWidget.item(i).text() for i in range(self.listWidget.count())]
+        return list(self._paths)
@@ -1,4 +1,7 @@
-from PyQt6.QtCore import Qt
+import functools
+import re
+
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout
 from qfluentwidgets import MessageBoxBase, SubtitleLabel, PlainTextEdit
 
@@ -6,6 +9,39 @@ from dcpm.infra.config.user_config import load_user_config
 from dcpm.ui.components.flow_layout import FlowLayout
 from dcpm.ui.theme.colors import get_tag_colors
 
+_TAG_SPLIT = re.compile(r'[,;\n]+')
+
+
+@functools.lru_cache(maxsize=128)
+def _chip_qss(bg: str, fg: str) -> str:
+    """同一配色的预设标签共用一份样式表字符串"""
+    return f"""
+        QPushButton {{
+            background-color: {bg};
+            color: {fg};
+            border: 1px solid {fg}40;
+            border-radius: 14px;
+            padding: 0 12px;
+            font-family: "Microsoft YaHei";
+            font-size: 12px;
+        }}
+        QPushButton:checked {{
+            background-color: {fg};
+            color: white;
+            border: 1px solid {fg};
+        }}
+        QPushButton:hover:!checked {{
+            border: 1px solid {fg};
+            background-color: {bg};
+        }}
+    """
+
+
+def _parse_tags(text: str) -> list[str]:
+    """按逗号/分号/换行一次切分，去掉首尾空白与空项"""
+    return [s for s in (x.strip() for x in _TAG_SPLIT.split(text)) if s]
+
+
 class TagDialog(MessageBoxBase):
     def __init__(self, title: str, content: str, parent=None):
         super().__init__(parent)
@@ -19,45 +55,30 @@ class TagDialog(MessageBoxBase):
         self.chips = {}
         
         # 解析当前已有标签
-        current_tags = [t.strip() for t in content.replace('\n', ',').replace(';', ',').split(',') if t.strip()]
+        current_tags = _parse_tags(content)
+        current_set = set(current_tags)
         
-        # 创建预设标签 Chips
+        # 创建预设标签 Chips：批量添加期间暂停刷新，光标统一设在容器上
+        self.presetContainer.setUpdatesEnabled(False)
+        self.presetContainer.setCursor(Qt.CursorShape.PointingHandCursor)
         for tag in config.preset_tags:
             bg, fg = get_tag_colors(tag)
-            btn = QPushButton(tag)
+            btn = QPushButton(tag, self.presetContainer)
             btn.setCheckable(True)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setFixedHeight(28)
             
             # 样式：未选中时浅色背景，选中时深色背景
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {bg};
-                    color: {fg};
-                    border: 1px solid {fg}40;
-                    border-radius: 14px;
-                    padding: 0 12px;
-                    font-family: "Microsoft YaHei";
-                    font-size: 12px;
-                }}
-                QPushButton:checked {{
-                    background-color: {fg};
-                    color: white;
-                    border: 1px solid {fg};
-                }}
-                QPushButton:hover:!checked {{
-                    border: 1px solid {fg};
-                    background-color: {bg};
-                }}
-            """)
+            btn.setStyleSheet(_chip_qss(bg, fg))
             
-            if tag in current_tags:
+            if tag in current_set:
                 btn.setChecked(True)
                 
             # 使用闭包绑定 tag
             btn.toggled.connect(lambda checked, t=tag: self.on_chip_toggled(t, checked))
             self.presetLayout.addWidget(btn)
             self.chips[tag] = btn
+        self.presetContainer.setUpdatesEnabled(True)
+        self.presetContainer.updateGeometry()
 
         # 2. 文本输入区域
         self.textEdit = PlainTextEdit(self)
@@ -66,7 +87,11 @@ class TagDialog(MessageBoxBase):
         self.textEdit.setMinimumHeight(80)
         self.textEdit.setMinimumWidth(360)
         
-        # 双向绑定：文本变动同步更新 Chip 状态
+        # 双向绑定：文本变动同步更新 Chip 状态（停止输入 150ms 后合并为一次）
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(150)
+        self._sync_timer.timeout.connect(self._apply_text_sync)
         self.textEdit.textChanged.connect(self.on_text_changed)
 
         # 3. 组装布局
@@ -90,15 +115,17 @@ class TagDialog(MessageBoxBase):
         
         text = self.textEdit.toPlainText()
         # 清理并分割现有标签
-        tags = [t.strip() for t in text.replace('\n', ',').replace(';', ',').split(',') if t.strip()]
+        tags = _parse_tags(text)
         
+        # 集合只用于成员判断，列表保留原有顺序
+        tags_set = set(tags)
         if checked:
-            if tag not in tags:
+            if tag not in tags_set:
                 tags.append(tag)
         else:
-            # 如果存在则移除
-            if tag in tags:
-                tags.remove(tag)
+            # 如果存在则移除（同一标签可能被重复输入）
+            if tag in tags_set:
+                tags = [t for t in tags if t != tag]
                 
         # 重新组合文本
         self.textEdit.setPlainText(", ".join(tags))
@@ -106,12 +133,15 @@ class TagDialog(MessageBoxBase):
 
     def on_text_changed(self):
         """当手动修改文本时更新 Chip 状态"""
+        self._sync_timer.start()
+
+    def _apply_text_sync(self):
         text = self.textEdit.toPlainText()
-        tags = [t.strip() for t in text.replace('\n', ',').replace(';', ',').split(',') if t.strip()]
+        tags_set = set(_parse_tags(text))
         
         for tag, btn in self.chips.items():
             btn.blockSignals(True)
-            btn.setChecked(tag in tags)
+            btn.setChecked(tag in tags_set)
             btn.blockSignals(False)
 
     def get_text(self) -> str:
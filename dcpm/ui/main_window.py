@@ -1,35 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime
 from pathlib import Path
 import logging
 import traceback
+from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, QTimer, QEvent
+from PyQt6.QtCore import Qt, QTimer, QEvent, QObject, QRunnable, pyqtSignal
 from PyQt6.QtWidgets import (
     QFileDialog, QFrame, QHBoxLayout, QMainWindow, QStackedWidget, QWidget
 )
 from qfluentwidgets import InfoBar, InfoBarPosition
 
 from dcpm.ui.theme.colors import APP_BG, COLORS
-from dcpm.ui.views.file_browser import FileBrowser
 from dcpm.infra.config.user_config import UserConfig, load_user_config, save_user_config
 from dcpm.services.library_service import ProjectEntry
 from dcpm.services.index_service import (
     DashboardStats,
     get_recent_activity,
-    mark_opened_now,
 )
 
 from dcpm.ui.views.sidebar import SidebarWidget
 from dcpm.ui.views.right_panel import RightPanel
-from dcpm.ui.views.settings_interface import SettingsInterface
 from dcpm.ui.views.dashboard import DashboardView
 
+if TYPE_CHECKING:
+    # 文件浏览、设置页首次进入时才导入（见 _ensure_file_browser / _ensure_settings）
+    from dcpm.ui.views.file_browser import FileBrowser
+    from dcpm.ui.views.settings_interface import SettingsInterface
+
+def _fmt_time(iso: str) -> str:
+    """ISO 时间串 -> 最近动态里显示的 "MM-DD HH:MM"；标准格式按固定位置切片，其余才走解析"""
+    if len(iso) >= 16 and iso[4] == "-" and iso[10] in "T " and iso[13] == ":":
+        return f"{iso[5:10]} {iso[11:16]}"
+    return datetime.fromisoformat(iso).strftime("%m-%d %H:%M")
+
+
+# 主窗口样式表：全局背景/字体，分隔线按 objectName 选择，启动时设置一次
+_WINDOW_QSS = f"""
+    * {{ background: {APP_BG}; font-family: 'Segoe UI', 'Microsoft YaHei'; }}
+    QFrame#vDivider {{ background-color: {COLORS['border']}; }}
+"""
+
+
+# 最近动态圆点颜色，其余状态用 info
+_STATUS_COLOR = {
+    "completed": COLORS["success"],
+    "delivered": COLORS["success"],
+    "archived": COLORS["secondary"],
+}
+
+
+class _ActivitySignals(QObject):
+    ready = pyqtSignal(int, object)  # generation, 原始动态列表（失败时为 None）
+
+
+class _ActivityWorker(QRunnable):
+    """后台读取最近动态，结果带上发起时的序号，界面只采用最新一次"""
+
+    def __init__(self, generation: int, library_root: Path, signals: _ActivitySignals):
+        super().__init__()
+        self.generation = generation
+        self.library_root = library_root
+        self.signals = signals
+
+    def run(self):
+        try:
+            raw = get_recent_activity(self.library_root)
+        except Exception:
+            raw = None
+        try:
+            self.signals.ready.emit(self.generation, raw)
+        except RuntimeError:
+            pass
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("压铸项目管理系统")
         self.setMinimumSize(1400, 900)
         self.resize(1600, 1000)
-        self.setStyleSheet(f"background: {APP_BG}; font-family: 'Segoe UI', 'Microsoft YaHei';")
+        self.setStyleSheet(_WINDOW_QSS)
 
         root = QWidget(self)
         self.setCentralWidget(root)
@@ -40,7 +92,16 @@ class MainWindow(QMainWindow):
         layout.setSpacing(0)
 
         self._cfg = load_user_config()
-        self._library_root = self._cfg.library_root
+        self._library_root = ""
+        self._library_root_path: Path | None = None
+        self._set_library_root(self._cfg.library_root)
+        self._shown_stats: DashboardStats | None = None
+        # 离开看板期间项目数据被修改过（如文件标签），回到看板时才重新加载
+        self._dashboard_dirty = False
+        # 最近动态在后台读取；每次请求递增序号，过期的结果直接丢弃
+        self._activity_gen = 0
+        self._activity_signals = _ActivitySignals(self)
+        self._activity_signals.ready.connect(self._apply_activities)
 
         # 1. Sidebar
         self._sidebar = SidebarWidget(self)
@@ -57,21 +118,17 @@ class MainWindow(QMainWindow):
         self._dashboard.indexRebuilt.connect(self._on_index_rebuilt)
         self._stack.addWidget(self._dashboard)
 
-        # --- Page 2: File Browser ---
-        self._file_browser = FileBrowser(self._library_root)
-        self._file_browser.backRequested.connect(self._on_file_browser_back)
-        self._stack.addWidget(self._file_browser)
-
-        # --- Page 3: Settings ---
-        self._settings_interface = SettingsInterface(self)
-        self._stack.addWidget(self._settings_interface)
+        # --- Page 2 / 3: File Browser、Settings ---
+        # 首次进入时才创建（见 _ensure_file_browser / _ensure_settings），启动只构造看板
+        self._file_browser: FileBrowser | None = None
+        self._settings_interface: SettingsInterface | None = None
 
         layout.addWidget(self._stack, 1)  # Stretch
 
         # Divider
         line = QFrame()
         line.setFrameShape(QFrame.Shape.VLine)
-        line.setStyleSheet(f"background-color: {COLORS['border']};")
+        line.setObjectName("vDivider")
         line.setFixedWidth(1)
         layout.addWidget(line)
 
@@ -85,21 +142,48 @@ class MainWindow(QMainWindow):
         # Initial Load
         QTimer.singleShot(0, self._dashboard.reload_projects)
 
+    def closeEvent(self, event):
+        self._dashboard.shutdown()
+        super().closeEvent(event)
+
     def changeEvent(self, event):
         super().changeEvent(event)
         # Forward window state changes if needed, but Dashboard handles its own layout updates now.
         pass
 
+    def _set_library_root(self, root: str) -> None:
+        # 库根目录的 Path 随字符串一起更新，只构造一次
+        self._library_root = root
+        self._library_root_path = Path(root) if root else None
+
+    def _ensure_file_browser(self) -> FileBrowser:
+        if self._file_browser is None:
+            from dcpm.ui.views.file_browser import FileBrowser
+
+            self._file_browser = FileBrowser(self._library_root)
+            self._file_browser.backRequested.connect(self._on_file_browser_back)
+            self._file_browser.itemTagsChanged.connect(self._mark_dashboard_dirty)
+            self._stack.addWidget(self._file_browser)
+        return self._file_browser
+
+    def _ensure_settings(self) -> SettingsInterface:
+        if self._settings_interface is None:
+            from dcpm.ui.views.settings_interface import SettingsInterface
+
+            self._settings_interface = SettingsInterface(self)
+            self._stack.addWidget(self._settings_interface)
+        return self._settings_interface
+
     # --- Events ---
 
     def _on_nav_changed(self, key: str):
         if key == "settings":
-            self._stack.setCurrentWidget(self._settings_interface)
+            self._stack.setCurrentWidget(self._ensure_settings())
             return
 
-        # If coming back from settings or file browser, make sure we are on page 0
-        if self._stack.currentWidget() != self._stack.widget(0):
-            self._stack.setCurrentIndex(0)
+        # If coming back from settings or file browser, make sure we are on the dashboard
+        if self._stack.currentWidget() is not self._dashboard:
+            self._show_dashboard()
 
         self._dashboard.set_nav_filter(key)
 
@@ -114,18 +198,18 @@ class MainWindow(QMainWindow):
     def _on_tag_selected(self, tag: str):
         # 简单实现：点击搜索框填入
         self._right_panel.search_box.setText(tag)
+        self._dashboard.flush_search()
 
     def _on_project_opened(self, entry: ProjectEntry):
-        if not self._library_root: return
+        if self._library_root_path is None: return
         try:
-            try: 
-                mark_opened_now(Path(self._library_root), entry.project.id)
-            except Exception as e: 
-                logging.warning(f"Failed to mark project opened: {e}")
-            
+            # 写库在看板的索引线程中进行，这里只更新内存
+            self._dashboard.mark_opened(entry.project.id)
+
             # Switch to File Browser view
-            self._file_browser.set_root(entry.project_dir, f"{entry.project.id} ({entry.project.name})", entry.project.id)
-            self._stack.setCurrentIndex(1)
+            browser = self._ensure_file_browser()
+            browser.set_root(entry.project_dir, f"{entry.project.id} ({entry.project.name})", entry.project.id)
+            self._stack.setCurrentWidget(browser)
         except Exception as e:
             traceback_str = "".join(traceback.format_exception(type(e), e, e.__traceback__))
             logging.error(f"Error opening project:\n{traceback_str}")
@@ -142,59 +226,72 @@ class MainWindow(QMainWindow):
         
         # Do NOT reload dashboard here. It's hidden anyway, and reloading might cause crashes 
         # if the sender button is destroyed during event handling.
-        # We will reload when coming back.
+        # The opened entry is patched in memory instead (see patch_last_opened).
 
     def _on_file_browser_back(self):
-        self._stack.setCurrentIndex(0)
-        # Reload dashboard data to reflect changes (e.g. last opened time)
-        self._dashboard.reload_projects()
+        self._show_dashboard()
+
+    def _mark_dashboard_dirty(self):
+        self._dashboard_dirty = True
+
+    def _show_dashboard(self):
+        self._stack.setCurrentWidget(self._dashboard)
+        if self._dashboard_dirty:
+            self._dashboard_dirty = False
+            # 重新加载完成后 dataLoaded 会顺带刷新最近动态
+            self._dashboard.reload_projects()
+        else:
+            # 打开时间已在内存中更新，这里只刷新最近动态
+            self._update_activities()
 
     def _on_dashboard_data_loaded(self, stats: DashboardStats):
+        # 统计未变时侧栏月份与标签保持原样，只刷新最近动态（改名等操作会影响它）
+        if stats == self._shown_stats:
+            self._update_activities()
+            return
+        self._shown_stats = stats
         self._update_sidebar_data(stats)
         self._update_right_panel_data(stats)
 
     def _on_index_rebuilt(self, enabled: bool):
-        self._sidebar.index_status.setText("索引已启用" if enabled else "普通模式")
-        self._sidebar.index_status.setStyleSheet(f"color: {COLORS['success'] if enabled else COLORS['warning']}; font-size: 11px;")
+        self._sidebar.set_index_state(enabled)
 
     def _update_sidebar_data(self, stats: DashboardStats):
-        # Format for Sidebar: [(name, key, count), ...]
-        display_months = []
-        for month, count in stats.month_counts:
-            # month is "YYYY-MM"
-            display_months.append((month, f"month:{month}", count))
-        self._sidebar.update_months(display_months)
+        self._sidebar.update_months(stats.month_counts)
 
     def _update_right_panel_data(self, stats: DashboardStats):
         # Tags
         self._right_panel.update_tags(stats.popular_tags, set())
+        self._update_activities()
 
-        # Activities
-        try:
-            from datetime import datetime
-            raw_acts = get_recent_activity(Path(self._library_root))
-            activities = []
-            for act in raw_acts:
-                # act: {id, name, customer, status, time}
-                name = act["name"]
-                time_str = datetime.fromisoformat(act["time"]).strftime("%m-%d %H:%M")
-                status = act["status"]
-                
-                color = COLORS["info"]
-                if status == "completed" or status == "delivered":
-                    color = COLORS["success"]
-                elif status == "archived":
-                    color = COLORS["secondary"]
-                
-                activities.append((f"操作了项目 {name}", time_str, color))
-            self._right_panel.update_activities(activities)
-        except Exception:
+    def _update_activities(self):
+        self._activity_gen += 1
+        if self._library_root_path is None:
             self._right_panel.update_activities([])
+            return
+        # 读库放到看板的索引线程：排在之前的写入（如打开时间）之后，读到的总是最新数据
+        self._dashboard.start_index_task(
+            _ActivityWorker(self._activity_gen, self._library_root_path, self._activity_signals)
+        )
+
+    def _apply_activities(self, generation: int, raw_acts: list | None):
+        if generation != self._activity_gen:
+            return
+        activities = []
+        for act in raw_acts or []:
+            try:
+                # act: {id, name, customer, status, time}
+                time_str = _fmt_time(act["time"])
+            except (KeyError, ValueError):
+                continue
+            color = _STATUS_COLOR.get(act["status"], COLORS["info"])
+            activities.append((f"操作了项目 {act['name']}", time_str, color))
+        self._right_panel.update_activities(activities)
 
     def _pick_library_root(self):
         path = QFileDialog.getExistingDirectory(self, "选择压铸项目库根目录", self._library_root or "")
         if not path: return
-        self._library_root = path
+        self._set_library_root(path)
         cfg = load_user_config()
         save_user_config(UserConfig(
             library_root=path,
@@ -206,6 +303,7 @@ class MainWindow(QMainWindow):
         ))
         
         self._dashboard.set_library_root(path)
-        self._file_browser.set_root(None) # Reset file browser
+        if self._file_browser is not None:
+            self._file_browser.set_root(None) # Reset file browser
         
         self._sidebar.index_status.setText("加载中...")
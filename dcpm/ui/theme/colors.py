@@ -1,5 +1,8 @@
+from functools import lru_cache
+from types import MappingProxyType
 
-COLORS = {
+# 主题色、标签配色均为只读，防止运行时被意外修改
+_COLORS = {
     'bg': '#F8F9FA',
     'card': '#FFFFFF',
     'primary': '#E65100',
@@ -14,12 +17,30 @@ COLORS = {
     'shadow': '#000000',
     'error': '#DC3545'
 }
+COLORS = MappingProxyType(_COLORS)
 
 PRIMARY_COLOR = COLORS['primary']
 APP_BG = COLORS['bg']
 
+# 删除等危险操作的按钮样式：确认框里的红色主按钮、描边的次要按钮
+DESTRUCTIVE_CONFIRM_QSS = (
+    "QPushButton { background-color: #dc2626; color: white; border: none; } "
+    "QPushButton:hover { background-color: #b91c1c; }"
+)
+DESTRUCTIVE_SECONDARY_QSS = f"""
+    QPushButton {{
+        color: {COLORS['error']};
+        border: 1px solid {COLORS['border']};
+        background: transparent;
+    }}
+    QPushButton:hover {{
+        background: #FEE2E2;
+        border: 1px solid #FECACA;
+    }}
+"""
+
 # 标签专用配色方案 (柔和色系)
-TAG_PALETTE = [
+TAG_PALETTE = (
     '#E3F2FD', # Blue
     '#E8F5E9', # Green
     '#F3E5F5', # Purple
@@ -30,9 +51,9 @@ TAG_PALETTE = [
     '#FFF8E1', # Amber
     '#ECEFF1', # Blue Grey
     '#F9FBE7', # Lime
-]
+)
 
-TAG_TEXT_PALETTE = [
+TAG_TEXT_PALETTE = (
     '#1565C0', # Blue
     '#2E7D32', # Green
     '#7B1FA2', # Purple
@@ -43,10 +64,10 @@ TAG_TEXT_PALETTE = [
     '#F57F17', # Amber
     '#455A64', # Blue Grey
     '#827717', # Lime
-]
+)
 
 # 特定标签的固定颜色映射 (可选)
-PRESET_TAG_COLORS = {
+PRESET_TAG_COLORS = MappingProxyType({
     '#第一版': 0, # Blue
     '#第二版': 2, # Purple
     '#模具': 5,   # Teal
@@ -55,16 +76,20 @@ PRESET_TAG_COLORS = {
     '#模流报告': 6, # Pink
     '#压铸参数计算': 8, # Blue Grey
     '#压射参数': 4, # Red
-}
+})
+
+# 预设标签直接映射到 (背景色, 文字色)
+_PRESET_RESOLVED = {k: (TAG_PALETTE[v], TAG_TEXT_PALETTE[v]) for k, v in PRESET_TAG_COLORS.items()}
+
 
+@lru_cache(maxsize=512)
 def get_tag_colors(tag_text: str) -> tuple[str, str]:
     """
-    根据标签文本返回 (背景色, 文字色)
+    根据标签文本返回 (背景色, 文字色)；逐个标签绘制时频繁调用，结果按标签缓存
     """
-    if tag_text in PRESET_TAG_COLORS:
-        idx = PRESET_TAG_COLORS[tag_text]
-    else:
-        # 使用哈希值确定的随机颜色
-        idx = abs(hash(tag_text)) % len(TAG_PALETTE)
-    
+    preset = _PRESET_RESOLVED.get(tag_text)
+    if preset is not None:
+        return preset
+    # 使用哈希值确定的随机颜色
+    idx = abs(hash(tag_text)) % len(TAG_PALETTE)
     return TAG_PALETTE[idx], TAG_TEXT_PALETTE[idx]
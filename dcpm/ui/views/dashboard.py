@@ -1,8 +1,13 @@
+import logging
 from pathlib import Path
+from dataclasses import replace
 from datetime import datetime
+from functools import partial
+from itertools import groupby
+from typing import Callable
 
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent, QThread
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QEvent, QThread, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QFont, QActionGroup
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QScrollArea, QGridLayout, QDialog
 )
@@ -39,6 +44,215 @@ class RebuildIndexThread(QThread):
     def stop(self):
         self._is_running = False
         self.wait(1000)
+
+
+class ReloadSignals(QObject):
+    finished = pyqtSignal(object, object, bool, bool)  # 首页 entries, DashboardStats | None, fts5_enabled, done
+    page = pyqtSignal(object, bool)  # 后续一页 entries, done
+
+
+# 项目列表分页读取：首页先显示，其余页在同一任务里陆续追加
+_PAGE_SIZE = 100
+
+
+class ReloadTask(QRunnable):
+    """后台加载项目列表与统计数据（在索引线程池中执行）"""
+
+    def __init__(self, library_root: Path, auto_index: bool, signals: ReloadSignals):
+        super().__init__()
+        self.library_root = library_root
+        self.auto_index = auto_index
+        self.signals = signals
+        # 界面侧置位：结果已过期，不必再取后续页
+        self.cancelled = False
+
+    def run(self):
+        entries: list = []
+        stats = None
+        fts5_enabled = False
+        has_more = False
+        try:
+            result = search(self.library_root, "", include_archived=True, limit=_PAGE_SIZE)
+            # 首次加载为空时自动建索引
+            if self.auto_index and not result.entries:
+                try:
+                    rebuild_index(self.library_root, include_archived=True)
+                    result = search(self.library_root, "", include_archived=True, limit=_PAGE_SIZE)
+                except Exception:
+                    pass
+            entries = result.entries
+            fts5_enabled = result.fts5_enabled
+            has_more = result.has_more
+        except Exception:
+            pass
+
+        try:
+            stats = get_dashboard_stats(self.library_root)
+        except Exception:
+            pass
+
+        try:
+            self.signals.finished.emit(entries, stats, fts5_enabled, not has_more)
+            offset = len(entries)
+            while has_more:
+                page: list = []
+                try:
+                    if not self.cancelled:
+                        result = search(self.library_root, "", include_archived=True, limit=_PAGE_SIZE, offset=offset)
+                        page = result.entries
+                        offset += len(page)
+                        has_more = result.has_more
+                    else:
+                        has_more = False
+                except Exception:
+                    has_more = False
+                self.signals.page.emit(page, not has_more)
+        except RuntimeError:
+            # 窗口已关闭，信号对象已销毁
+            pass
+
+
+class PinSignals(QObject):
+    failed = pyqtSignal(str, bool, str)  # project id, 目标置顶状态, 错误信息
+
+
+class PinTask(QRunnable):
+    """后台写入置顶状态；界面已先行更新，失败时通知回滚"""
+
+    def __init__(self, library_root: Path, project_id: str, pinned: bool, signals: PinSignals):
+        super().__init__()
+        self.library_root = library_root
+        self.project_id = project_id
+        self.pinned = pinned
+        self.signals = signals
+
+    def run(self):
+        try:
+            toggle_pinned(self.library_root, self.project_id, self.pinned)
+        except Exception as e:
+            try:
+                self.signals.failed.emit(self.project_id, self.pinned, str(e))
+            except RuntimeError:
+                pass
+
+
+class IndexWriteSignals(QObject):
+    failed = pyqtSignal(str)  # 错误信息
+
+
+class IndexWriteTask(QRunnable):
+    """在索引线程池中执行一次写库（排在之前的加载 / 写入之后），失败时通知界面"""
+
+    def __init__(self, write: Callable[[], object], signals: IndexWriteSignals | None):
+        super().__init__()
+        self.write = write
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.write()
+        except Exception as e:
+            if self.signals is None:
+                return
+            try:
+                self.signals.failed.emit(str(e))
+            except RuntimeError:
+                pass
+
+
+class PurgeTrashTask(QRunnable):
+    """后台清空回收目录；删除项目时界面只做改名，不等待文件真正删完"""
+
+    def __init__(self, library_root: Path):
+        super().__init__()
+        self.library_root = library_root
+
+    def run(self):
+        try:
+            leftover = purge_trash(self.library_root)
+        except Exception:
+            logging.exception("Purging trash failed: %s", self.library_root)
+            return
+        if leftover:
+            logging.warning(
+                "Purging trash left %d item(s) behind: %s",
+                len(leftover),
+                ", ".join(str(p) for p in leftover[:5]),
+            )
+
+
+class SearchSignals(QObject):
+    finished = pyqtSignal(int, object)  # generation, 命中的 project id 列表
+
+
+class SearchTask(QRunnable):
+    """在索引线程池中按关键字 + 状态 / 月份 / 置顶检索，补上内存过滤覆盖不到的命中（文件名、检查项路径等）"""
+
+    def __init__(
+        self,
+        generation: int,
+        library_root: Path,
+        query: str,
+        include_archived: bool,
+        status: str | None,
+        month: str | None,
+        pinned_only: bool,
+        signals: SearchSignals,
+    ):
+        super().__init__()
+        self.generation = generation
+        self.library_root = library_root
+        self.query = query
+        self.include_archived = include_archived
+        self.status = status
+        self.month = month
+        self.pinned_only = pinned_only
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = search(
+                self.library_root,
+                self.query,
+                include_archived=self.include_archived,
+                status=self.status,
+                month=self.month,
+                pinned_only=self.pinned_only,
+            )
+            ids = [e.project.id for e in result.entries]
+        except Exception:
+            ids = []
+        try:
+            self.signals.finished.emit(self.generation, ids)
+        except RuntimeError:
+            pass
+
+
+class ScanSignals(QObject):
+    finished = pyqtSignal(object)  # 扫描时用的 Project
+
+
+class TargetedScanTask(QRunnable):
+    """按单个项目增量扫描共享盘（在扫描线程池中排队执行）"""
+
+    def __init__(self, library_root: Path, shared_paths: list[str], project, signals: ScanSignals):
+        super().__init__()
+        self.library_root = library_root
+        self.shared_paths = shared_paths
+        self.project = project
+        self.signals = signals
+
+    def run(self):
+        try:
+            targeted_scan_and_link(self.library_root, self.shared_paths, self.project)
+        except Exception:
+            pass
+        try:
+            self.signals.finished.emit(self.project)
+        except RuntimeError:
+            pass
+
+
 from qfluentwidgets import (
     SubtitleLabel, DropDownPushButton, RoundMenu, Action, Pivot, InfoBar, InfoBarPosition, BodyLabel, MessageBoxBase,
     PushButton, PrimaryPushButton, FluentIcon as FI
@@ -48,18 +262,20 @@ from dcpm.services.library_service import ProjectEntry
 from dcpm.services.index_service import (
     DashboardStats,
     get_dashboard_stats,
+    mark_opened_now,
     rebuild_index,
     search,
     toggle_pinned,
     upsert_one_project,
     delete_project_index
 )
+from dcpm.services.scanner_service import targeted_scan_and_link
 from dcpm.services.project_service import (
-    create_project, delete_project_physically, edit_project_metadata,
+    create_project, trash_project_dir, purge_trash, edit_project_metadata,
     clear_project_cover, set_project_cover, archive_project, unarchive_project
 )
 from dcpm.services.note_service import NoteService
-from dcpm.ui.theme.colors import COLORS
+from dcpm.ui.theme.colors import COLORS, DESTRUCTIVE_CONFIRM_QSS
 from dcpm.ui.components.project_card import ProjectCard, ProjectCardOptions
 from dcpm.ui.components.cards import StatCard
 from dcpm.ui.components.note_dialog import NoteDialog
@@ -67,6 +283,62 @@ from dcpm.ui.dialogs.create_project import CreateProjectDialog
 from dcpm.ui.dialogs.manage_project import ManageProjectDialog
 from dcpm.infra.config.user_config import load_user_config
 
+
+# 样式表只依赖主题色，导入时生成一次，重建时直接复用同一字符串
+_TITLE_QSS = f"color: {COLORS['text']};"
+_SUBTITLE_QSS = f"color: {COLORS['text_muted']}; font-size: 14px;"
+_MONTH_HEADER_QSS = f"color: {COLORS['primary']}; font-weight: bold; margin-top: 12px;"
+_TRANSPARENT_QSS = "background: transparent;"
+
+
+# 状态筛选按钮文字、侧栏导航对应的标题
+_STATUS_LABELS = {
+    "all": "📁 全部状态",
+    "ongoing": "📁 进行中",
+    "delivered": "📁 已交付",
+    "archived": "📁 已归档",
+}
+_NAV_TITLES = {
+    "all": "全部项目",
+    "pinned": "置顶项目",
+    "status:ongoing": "进行中项目",
+    "status:delivered": "已交付项目",
+    "status:archived": "归档项目",
+}
+
+
+# 网格 / 列表卡片行高（含间距），用于按可见区域分批创建卡片
+_GRID_ROW_H = 180 + 24
+_LIST_ROW_H = 80 + 12
+_TIMELINE_HEADER_H = 36 + 12
+_OVERSCAN_ROWS = 2
+_MAX_SPARE_CARDS = 24
+
+
+def _month_str(dt: datetime) -> str:
+    """创建时间 -> "YYYY-MM"；直接拼字段，省去 strftime 的格式解析与 locale 查询"""
+    return f"{dt.year:04d}-{dt.month:02d}"
+
+
+def _search_blob(entry: ProjectEntry) -> str:
+    """拼接项目可搜索字段（小写），加载后每个项目只算一次"""
+    p = entry.project
+    item_tags = []
+    for tags in (p.item_tags or {}).values():
+        item_tags.extend(tags or [])
+    return " ".join([
+        p.id or "",
+        p.name or "",
+        p.customer or "",
+        p.customer_code or "",
+        p.part_number or "",
+        p.material or "",
+        p.description or "",
+        " ".join(p.tags or []),
+        " ".join(item_tags),
+    ]).lower()
+
+
 class DashboardView(QWidget):
     projectOpened = pyqtSignal(object)  # ProjectEntry
     dataLoaded = pyqtSignal(object)     # DashboardStats
@@ -74,28 +346,91 @@ class DashboardView(QWidget):
 
     def __init__(self, library_root: str, parent=None):
         super().__init__(parent)
-        self._library_root = library_root
+        self._library_root = ""
+        self._library_root_path: Path | None = None
+        self._note_service: NoteService | None = None
+        # 回收目录清理逐个排队执行，避免两次清理同时删除同一批条目
+        self._purge_pool = QThreadPool(self)
+        self._purge_pool.setMaxThreadCount(1)
+        self._set_library_root(library_root)
         self._all_projects: list[ProjectEntry] = []
         self._filtered_projects: list[ProjectEntry] = []
+        self._search_blobs: dict[str, str] = {}  # project id -> 小写搜索文本
+        self._month_keys: dict[str, str] = {}    # project id -> "YYYY-MM"
+        self._filtered_groups: list[tuple[str, list[ProjectEntry]]] | None = None  # 时间线分组，切到时间线时才算
+        # 卡片池：(project id, compact, checkable) -> 卡片，重建网格时复用而不是重新创建
+        self._card_pool: dict[tuple[str, bool, bool], ProjectCard] = {}
+        # 已删除项目留下的卡片按 (compact, checkable) 备用，新项目出现时改绑数据而不是新建
+        self._spare_cards: dict[tuple[bool, bool], list[ProjectCard]] = {}
+        self._manage_dialog: ManageProjectDialog | None = None
+        self._manage_entry: ProjectEntry | None = None
+        # 按需创建：(layout, cols, row_h, compact)，以及已放入布局的卡片数
+        self._lazy_fill: tuple[QGridLayout | QVBoxLayout, int, int, bool] | None = None
+        self._materialized = 0
+        # 时间线按需创建用：(y 偏移, 月份标题或项目) 的扁平序列
+        self._timeline_items: list[tuple[int, str | ProjectEntry]] = []
         self._view_mode = "grid"
+        self._last_window_state = Qt.WindowState.WindowNoState
+        self._fill_scheduled = False
         self._status_filter = "all"
         self._time_filter = "all"
         self._tag_filter = "all"
         self._search_query = ""
+        # 上次过滤用的条件；条件未变且数据未变时跳过过滤与重建
+        self._last_filter_key: tuple | None = None
+        self._shown_stats: DashboardStats | None = None
         self._auto_index_attempted = False
+        self._reloading = False
+        self._reload_pending = False
+        # 加载放在单线程、常驻的线程池里：同一线程可一直复用 index_service 的连接
+        self._index_pool = QThreadPool(self)
+        self._index_pool.setMaxThreadCount(1)
+        self._index_pool.setExpiryTimeout(-1)
+        self._reload_signals = ReloadSignals(self)
+        self._reload_signals.finished.connect(self._on_reload_done)
+        self._reload_signals.page.connect(self._on_reload_page)
+        self._reload_task: ReloadTask | None = None
+        self._pin_signals = PinSignals(self)
+        self._pin_signals.failed.connect(self._on_pin_failed)
+        self._write_signals = IndexWriteSignals(self)
+        self._write_signals.failed.connect(self._show_error)
+        # 新建 / 改名后的共享盘扫描逐个排队，同一项目排队期间只记最新的数据
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._scan_pending: dict[str, object] = {}
+        self._scan_signals = ScanSignals(self)
+        self._scan_signals.finished.connect(self._on_scan_finished)
+        # 索引检索：只采用最近一次过滤发起的结果
+        self._search_gen = 0
+        self._search_signals = SearchSignals(self)
+        self._search_signals.finished.connect(self._on_search_done)
+
+        # 搜索防抖：连续输入只在停顿 120ms 后过滤一次
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(self._apply_filter)
         
         # Batch mode
         self._is_batch_mode = False
         self._selected_ids: set[str] = set()
         
-        # Init Note Service if library root is available
-        self._note_service = NoteService(Path(self._library_root)) if self._library_root else None
-
         self._init_ui()
     
-    def set_library_root(self, root: str):
+    def _set_library_root(self, root: str) -> None:
+        """库根目录的字符串与 Path 一起更新；Path 只构造一次，各处直接复用"""
         self._library_root = root
-        self._note_service = NoteService(Path(root)) if root else None
+        self._library_root_path = Path(root) if root else None
+        self._note_service = NoteService(self._library_root_path) if root else None
+        if self._library_root_path is not None:
+            # 清理上次退出前没删完的项目文件夹
+            self._start_purge_trash()
+
+    def _start_purge_trash(self) -> None:
+        self._purge_pool.start(PurgeTrashTask(self._library_root_path))
+
+    def set_library_root(self, root: str):
+        self._set_library_root(root)
         self.reload_projects()
 
     def _init_ui(self):
@@ -110,11 +445,11 @@ class DashboardView(QWidget):
 
         self._title_label = QLabel("全部项目")
         self._title_label.setFont(QFont("Microsoft YaHei", 24, QFont.Weight.Bold))
-        self._title_label.setStyleSheet(f"color: {COLORS['text']};")
+        self._title_label.setStyleSheet(_TITLE_QSS)
         title_layout.addWidget(self._title_label)
 
         self._subtitle_label = QLabel("正在加载...")
-        self._subtitle_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 14px;")
+        self._subtitle_label.setStyleSheet(_SUBTITLE_QSS)
         title_layout.addWidget(self._subtitle_label)
 
         header_layout.addLayout(title_layout)
@@ -133,9 +468,17 @@ class DashboardView(QWidget):
         # Stats Bar
         self._stats_layout = QHBoxLayout()
         self._stats_layout.setSpacing(20)
-        # Placeholders
-        for _ in range(4):
-            self._stats_layout.addWidget(StatCard("-", "0", "-", COLORS["secondary"], 0))
+        # 四张统计卡片只创建一次，加载后用 set_values 更新
+        self._stat_cards: list[StatCard] = []
+        for title, color in (
+            ("本月新建", COLORS["primary"]),
+            ("进行中", COLORS["info"]),
+            ("已交付", COLORS["success"]),
+            ("项目总数", COLORS["warning"]),
+        ):
+            card = StatCard(title, "0", "-", color, 0)
+            self._stat_cards.append(card)
+            self._stats_layout.addWidget(card)
         layout.addLayout(self._stats_layout)
 
         # Filter Bar
@@ -160,6 +503,11 @@ class DashboardView(QWidget):
         self._time_btn.setFixedHeight(40)
         self._time_menu = RoundMenu(parent=self._time_btn)
         self._time_btn.setMenu(self._time_menu)
+        # 菜单项的筛选值放在 action.data() 里，整组共用一个槽
+        self._time_group = QActionGroup(self)
+        self._time_group.setExclusionPolicy(QActionGroup.ExclusionPolicy.None_)
+        self._time_group.triggered.connect(lambda a: self.set_filter("time", a.data()))
+        self._time_items: tuple = ()
         filter_layout.addWidget(self._time_btn)
 
         # 标签筛选下拉
@@ -167,6 +515,10 @@ class DashboardView(QWidget):
         self._tag_btn.setFixedHeight(40)
         self._tag_menu = RoundMenu(parent=self._tag_btn)
         self._tag_btn.setMenu(self._tag_menu)
+        self._tag_group = QActionGroup(self)
+        self._tag_group.setExclusionPolicy(QActionGroup.ExclusionPolicy.None_)
+        self._tag_group.triggered.connect(lambda a: self.set_filter("tag", a.data()))
+        self._tag_items: tuple = ()
         filter_layout.addWidget(self._tag_btn)
 
         filter_layout.addStretch()
@@ -189,100 +541,162 @@ class DashboardView(QWidget):
         self._scroll = QScrollArea()
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self._scroll.setStyleSheet("background: transparent;")
+        self._scroll.setStyleSheet(_TRANSPARENT_QSS)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         self._grid_container = QWidget()
         QVBoxLayout(self._grid_container).setContentsMargins(0, 0, 0, 0)
 
         self._scroll.setWidget(self._grid_container)
+        self._scroll.verticalScrollBar().valueChanged.connect(self._fill_visible)
         layout.addWidget(self._scroll)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # 视口变高后可能露出尚未创建卡片的行
+        self._fill_visible()
+
     def changeEvent(self, event):
         super().changeEvent(event)
         if event.type() != QEvent.Type.WindowStateChange:
             return
-        if getattr(self, "_view_mode", None) != "grid":
+        # 只关心最大化 / 全屏的切换；最小化、还原、激活等状态变化不影响布局
+        state = self.window().windowState()
+        changed = state ^ self._last_window_state
+        self._last_window_state = state
+        if not changed & (Qt.WindowState.WindowMaximized | Qt.WindowState.WindowFullScreen):
             return
-        # Delay rebuild to ensure geometry is correct
-        QTimer.singleShot(0, self._rebuild_grid)
+        # 网格固定 3 列、随宽度拉伸，不必重建；几何稳定后补齐新露出的行即可，连续切换只排一次
+        if not self._fill_scheduled:
+            self._fill_scheduled = True
+            QTimer.singleShot(0, self._deferred_fill)
+
+    def _deferred_fill(self) -> None:
+        self._fill_scheduled = False
+        self._fill_visible()
 
     def reload_projects(self) -> None:
-        if not self._library_root:
+        if self._library_root_path is None:
             self._all_projects = []
             self._filtered_projects = []
+            self._filtered_groups = None
+            self._last_filter_key = None
             self._rebuild_grid()
             return
 
-        include_archived = self._status_filter == "archived" or self._status_filter == "all"
-        result = search(Path(self._library_root), "", include_archived=True, limit=500)
-
-        # Auto-index check
-        if (not self._auto_index_attempted) and (not result.entries):
-            self._auto_index_attempted = True
-            try:
-                db = rebuild_index(Path(self._library_root), include_archived=True)
-                self.indexRebuilt.emit(db.fts5_enabled)
-                result = search(Path(self._library_root), "", include_archived=True, limit=500)
-            except Exception:
-                pass
-        else:
-            self.indexRebuilt.emit(result.fts5_enabled)
+        # 正在加载时只记一笔，完成后再补一次，避免并发线程
+        if self._reloading:
+            self._mark_reload_stale()
+            return
+        self._reloading = True
+        self._reload_pending = False
+
+        auto_index = not self._auto_index_attempted
+        self._auto_index_attempted = True
+
+        self._reload_task = ReloadTask(self._library_root_path, auto_index, self._reload_signals)
+        self._index_pool.start(self._reload_task)
+
+    def _mark_reload_stale(self) -> None:
+        """进行中的加载结果已过期：停止取后续页，全部结束后再补一次"""
+        self._reload_pending = True
+        if self._reload_task is not None:
+            self._reload_task.cancelled = True
+
+    def _finish_reload_if_stale(self, done: bool) -> bool:
+        if done:
+            self._reloading = False
+            self._reload_task = None
+        if not self._reload_pending:
+            return False
+        if done:
+            # 加载期间数据又变了，结果已过期，直接重新加载
+            self.reload_projects()
+        return True
 
-        self._all_projects = result.entries
+    def _on_reload_done(self, entries: list, stats: DashboardStats | None, fts5_enabled: bool, done: bool):
+        if self._finish_reload_if_stale(done):
+            return
 
-        # Load Dashboard Stats
-        try:
-            stats = get_dashboard_stats(Path(self._library_root))
-            self._update_stats(stats)
-            self._update_filter_menus(stats)
+        self.indexRebuilt.emit(fts5_enabled)
+        self._all_projects = entries
+        self._last_filter_key = None
+        self._search_blobs = {e.project.id: _search_blob(e) for e in entries}
+        self._month_keys = {e.project.id: _month_str(e.project.create_time) for e in entries}
+        if done:
+            self._prune_card_pool()
+
+        if stats is not None:
+            # 置顶、改名等写入后重新加载时统计常常没变，卡片和菜单就不必重建
+            if stats != self._shown_stats:
+                self._shown_stats = stats
+                self._update_stats(stats)
+                self._update_filter_menus(stats)
             self.dataLoaded.emit(stats) # Notify MainWindow to update sidebar/right panel
-        except Exception:
-            pass
 
         self._apply_filter()
 
-    def _update_stats(self, stats: DashboardStats):
-        # Clear old stats
-        while self._stats_layout.count():
-            item = self._stats_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def _on_reload_page(self, entries: list, done: bool) -> None:
+        """后续页追加到列表末尾（查询顺序一致），重新过滤"""
+        if self._finish_reload_if_stale(done):
+            return
+        if entries:
+            self._all_projects.extend(entries)
+            for e in entries:
+                self._search_blobs[e.project.id] = _search_blob(e)
+                self._month_keys[e.project.id] = _month_str(e.project.create_time)
+        if done:
+            self._prune_card_pool()
+        if entries:
+            self._last_filter_key = None
+            self._apply_filter()
 
+    def _update_stats(self, stats: DashboardStats):
         total = stats.total_projects
         ongoing = stats.processing_count
         delivered = stats.completed_count
         new_this_month = stats.new_this_month
 
         items = [
-            ("本月新建", str(new_this_month), "较上月 --", COLORS["primary"], min(1.0, new_this_month / 10)),
-            ("进行中", str(ongoing), "活跃项目", COLORS["info"], min(1.0, ongoing / max(1, total))),
-            ("已交付", str(delivered), "本月完成", COLORS["success"], min(1.0, delivered / max(1, total))),
-            ("项目总数", str(total), "全部项目", COLORS["warning"], 1.0),
+            (str(new_this_month), "较上月 --", min(1.0, new_this_month / 10)),
+            (str(ongoing), "活跃项目", min(1.0, ongoing / max(1, total))),
+            (str(delivered), "本月完成", min(1.0, delivered / max(1, total))),
+            (str(total), "全部项目", 1.0),
         ]
 
-        for title, value, subtitle, color, progress in items:
-            self._stats_layout.addWidget(StatCard(title, value, subtitle, color, progress))
+        for card, (value, subtitle, progress) in zip(self._stat_cards, items):
+            card.set_values(value, subtitle, progress)
 
     def _update_filter_menus(self, stats: DashboardStats):
         # Update Filter Menu (Time)
-        self._time_menu.clear()
-        self._time_menu.addAction(Action("全部时间", triggered=lambda: self.set_filter("time", "all")))
-        for month, count in stats.month_counts[:12]:
-             self._time_menu.addAction(Action(f"{month} ({count})", triggered=lambda m=month: self.set_filter("time", m)))
+        time_items = tuple(stats.month_counts[:12])
+        if time_items != self._time_items:
+            self._time_items = time_items
+            self._fill_filter_menu(self._time_menu, self._time_group, "全部时间", time_items)
 
         # Update Filter Menu (Tags)
-        self._tag_menu.clear()
-        self._tag_menu.addAction(Action("全部标签", triggered=lambda: self.set_filter("tag", "all")))
-        for tag, count in stats.popular_tags[:20]:
-            self._tag_menu.addAction(Action(f"{tag} ({count})", triggered=lambda t=tag: self.set_filter("tag", t)))
+        tag_items = tuple(stats.popular_tags[:20])
+        if tag_items != self._tag_items:
+            self._tag_items = tag_items
+            self._fill_filter_menu(self._tag_menu, self._tag_group, "全部标签", tag_items)
+
+    @staticmethod
+    def _fill_filter_menu(menu: RoundMenu, group: QActionGroup, all_text: str, items: tuple) -> None:
+        for old in group.actions():
+            group.removeAction(old)
+            old.deleteLater()
+        menu.clear()
+        actions = []
+        for text, value in [(all_text, "all")] + [(f"{v} ({count})", v) for v, count in items]:
+            action = Action(text, group)
+            action.setData(value)
+            actions.append(action)
+        menu.addActions(actions)
 
     def set_filter(self, type_: str, value: str):
         if type_ == "status":
             self._status_filter = "all" if value == "all" else f"status:{value}"
-            self._status_btn.setText("📁 全部状态" if value == "all" else {
-                "ongoing": "📁 进行中", "delivered": "📁 已交付", "archived": "📁 已归档"
-            }.get(value, value))
+            self._status_btn.setText(_STATUS_LABELS.get(value, value))
         elif type_ == "time":
             self._time_filter = value
             self._time_btn.setText("📅 全部时间" if value == "all" else f"📅 {value}")
@@ -295,82 +709,219 @@ class DashboardView(QWidget):
     # Public method for external search (e.g. from RightPanel)
     def set_search_query(self, query: str):
         self._search_query = query
-        self._apply_filter()
+        self._search_timer.start()
+
+    def flush_search(self) -> None:
+        """立即执行等待中的防抖搜索（点击标签等一次性输入不必等待）"""
+        if self._search_timer.isActive():
+            self._apply_filter()
+
+    def shutdown(self) -> None:
+        """窗口关闭前调用：丢弃待执行的防抖搜索，停止重建索引线程"""
+        self._search_timer.stop()
+        if getattr(self, "_rebuild_thread", None) is not None and self._rebuild_thread.isRunning():
+            self._rebuild_thread.stop()
 
     # Public method for external navigation (e.g. from Sidebar)
     def set_nav_filter(self, key: str):
         self._status_filter = key
-        self._title_label.setText({
-            "all": "全部项目",
-            "pinned": "置顶项目",
-            "status:ongoing": "进行中项目",
-            "status:delivered": "已交付项目",
-            "status:archived": "归档项目"
-        }.get(key, "项目列表"))
+        self._title_label.setText(_NAV_TITLES.get(key, "项目列表"))
         self._apply_filter()
 
     def _apply_filter(self) -> None:
         q = self._search_query.lower()
         terms = [term for term in q.split() if term]
+        filter_key = (tuple(terms), self._status_filter, self._time_filter, self._tag_filter)
+        prev_key = self._last_filter_key
+        if filter_key == prev_key:
+            self._search_timer.stop()
+            return
+        self._last_filter_key = filter_key
         filtered = []
 
-        for entry in self._all_projects:
+        # 继续输入时（其余条件不变、每个旧词都被某个新词包含）结果只会变少，只需在上次结果里再筛
+        source = self._all_projects
+        if (
+            prev_key is not None
+            and prev_key[0]
+            and prev_key[1:] == filter_key[1:]
+            and all(any(old in new for new in terms) for old in prev_key[0])
+        ):
+            source = self._filtered_projects
+
+        # 筛选条件在循环外解析一次，循环内只做比较
+        status_filter = self._status_filter
+        month_of = self._month_key
+        nav_kind, _, nav_value = status_filter.partition(":")
+        nav_pred: Callable[[ProjectEntry], bool] | None = None
+        if nav_kind == "pinned":
+            nav_pred = lambda e: e.pinned
+        elif nav_kind == "status":
+            nav_pred = lambda e: e.project.status == nav_value
+        elif nav_kind == "month":
+            nav_pred = lambda e: month_of(e) == nav_value
+        time_filter = None if self._time_filter == "all" else self._time_filter
+        tag_filter = None if self._tag_filter == "all" else self._tag_filter
+        show_archived = status_filter == "status:archived"
+        blobs = self._search_blobs
+
+        for entry in source:
             # 1. Status / Nav Filter
-            if self._status_filter != "all":
-                if self._status_filter == "pinned":
-                    if not entry.pinned: continue
-                elif self._status_filter.startswith("status:"):
-                    status = self._status_filter.split(":")[1]
-                    if entry.project.status != status: continue
-                elif self._status_filter.startswith("month:"):
-                    month = self._status_filter.split(":")[1]
-                    if entry.project.create_time.strftime("%Y-%m") != month: continue
+            if nav_pred is not None and not nav_pred(entry):
+                continue
 
             # 2. Top Bar Filters
-            if self._time_filter != "all":
-                 if entry.project.create_time.strftime("%Y-%m") != self._time_filter:
-                     continue
-            
-            if hasattr(self, "_tag_filter") and self._tag_filter != "all":
-                if self._tag_filter not in entry.project.tags:
-                    continue
+            if time_filter is not None and month_of(entry) != time_filter:
+                continue
+            if tag_filter is not None and tag_filter not in entry.project.tags:
+                continue
 
             # 3. Search Query
             if terms:
-                item_tags = []
-                for tags in (entry.project.item_tags or {}).values():
-                    item_tags.extend(tags or [])
-
-                searchable = " ".join([
-                    entry.project.id or "",
-                    entry.project.name or "",
-                    entry.project.customer or "",
-                    entry.project.customer_code or "",
-                    entry.project.part_number or "",
-                    entry.project.material or "",
-                    entry.project.description or "",
-                    " ".join(entry.project.tags or []),
-                    " ".join(item_tags),
-                ]).lower()
+                searchable = blobs.get(entry.project.id)
+                if searchable is None:
+                    searchable = blobs[entry.project.id] = _search_blob(entry)
                 if not all(term in searchable for term in terms):
                     continue
             
             # 4. Archive Hiding
-            if entry.project.status == "archived":
-                if self._status_filter != "status:archived":
-                     continue
+            if entry.project.status == "archived" and not show_archived:
+                continue
 
             filtered.append(entry)
 
+        self._search_timer.stop()
         self._filtered_projects = filtered
+        self._filtered_groups = None
         self._subtitle_label.setText(f"管理和追踪您的压铸项目，共 {len(filtered)} 个项目")
         self._rebuild_grid()
 
+        self._search_gen += 1
+        if terms and self._library_root_path is not None:
+            self._start_index_search(q, nav_kind, nav_value, time_filter, show_archived)
+
+    def _start_index_search(
+        self,
+        query: str,
+        nav_kind: str,
+        nav_value: str,
+        time_filter: str | None,
+        show_archived: bool,
+    ) -> None:
+        """关键字、状态、月份、置顶交给 SQLite 过滤；内存过滤已先给出结果，并负责中文中缀匹配"""
+        month = nav_value if nav_kind == "month" else None
+        if time_filter is not None:
+            if month is not None and month != time_filter:
+                return
+            month = time_filter
+        self._index_pool.start(
+            SearchTask(
+                self._search_gen,
+                self._library_root_path,
+                query,
+                show_archived,
+                nav_value if nav_kind == "status" else None,
+                month,
+                nav_kind == "pinned",
+                self._search_signals,
+            )
+        )
+
+    def _on_search_done(self, generation: int, ids: list) -> None:
+        """把索引命中、但内存过滤漏掉的项目追加到结果末尾"""
+        if generation != self._search_gen or not ids:
+            return
+        shown = {e.project.id for e in self._filtered_projects}
+        missing = [pid for pid in ids if pid not in shown]
+        if not missing:
+            return
+        by_id = {e.project.id: e for e in self._all_projects}
+        tag_filter = None if self._tag_filter == "all" else self._tag_filter
+        extra = []
+        for pid in missing:
+            entry = by_id.get(pid)
+            if entry is None:
+                continue
+            if tag_filter is not None and tag_filter not in entry.project.tags:
+                continue
+            extra.append(entry)
+        if not extra:
+            return
+        self._filtered_projects = self._filtered_projects + extra
+        self._filtered_groups = None
+        self._subtitle_label.setText(f"管理和追踪您的压铸项目，共 {len(self._filtered_projects)} 个项目")
+        self._rebuild_grid()
+
+    def _timeline_groups(self) -> list[tuple[str, list[ProjectEntry]]]:
+        """按月份倒序分组；稳定排序保留月内原有顺序（置顶优先、最近优先）"""
+        if self._filtered_groups is None:
+            month_of = self._month_key
+            ordered = sorted(self._filtered_projects, key=month_of, reverse=True)
+            self._filtered_groups = [(key, list(group)) for key, group in groupby(ordered, key=month_of)]
+        return self._filtered_groups
+
+    def _month_key(self, entry: ProjectEntry) -> str:
+        key = self._month_keys.get(entry.project.id)
+        if key is None:
+            key = self._month_keys[entry.project.id] = _month_str(entry.project.create_time)
+        return key
+
+    def _take_card(self, entry: ProjectEntry, compact: bool, checkable: bool) -> ProjectCard:
+        """从卡片池取卡片，没有才创建；信号只在创建时连接一次"""
+        pid = entry.project.id
+        key = (pid, compact, checkable)
+        card = self._card_pool.get(key)
+        if card is None:
+            spares = self._spare_cards.get((compact, checkable))
+            if spares:
+                card = self._card_pool[key] = spares.pop()
+        if card is None:
+            options = ProjectCardOptions(
+                compact=compact,
+                checkable=checkable,
+                checked=(pid in self._selected_ids)
+            )
+            card = ProjectCard(entry, options)
+            card.openRequested.connect(self.projectOpened.emit)
+            card.pinToggled.connect(self._pin_project)
+            card.manageRequested.connect(self.open_manage_project)
+            card.deleteRequested.connect(self._prompt_delete_project)
+            card.noteRequested.connect(self._open_project_note)
+            card.checkToggled.connect(self._on_card_toggled)
+            self._card_pool[key] = card
+            return card
+
+        if card.entry is not entry:
+            card.update_entry(entry)
+        if checkable:
+            card.setChecked(pid in self._selected_ids)
+        return card
+
+    def _prune_card_pool(self) -> None:
+        """已不存在项目的卡片移入备用池，超出上限的才销毁"""
+        alive = {e.project.id for e in self._all_projects}
+        for key in [k for k in self._card_pool if k[0] not in alive]:
+            card = self._card_pool.pop(key)
+            spares = self._spare_cards.setdefault(key[1:], [])
+            if len(spares) < _MAX_SPARE_CARDS:
+                card.setParent(None)
+                spares.append(card)
+            else:
+                card.hide()
+                card.deleteLater()
+
     def _rebuild_grid(self) -> None:
+        # 批量加卡片期间关掉重绘，结束后统一布局一次
+        self._scroll.setUpdatesEnabled(False)
         new_container = QWidget()
-        new_container.setStyleSheet("background: transparent;")
+        new_container.setStyleSheet(_TRANSPARENT_QSS)
+        new_container.setUpdatesEnabled(False)
         
         layout = None
+        self._lazy_fill = None
+        self._materialized = 0
+        self._timeline_items = []
+        count = len(self._filtered_projects)
         if self._view_mode == "grid":
             layout = QGridLayout(new_container)
             layout.setContentsMargins(0, 0, 0, 0)
@@ -379,64 +930,83 @@ class DashboardView(QWidget):
             layout.setColumnStretch(0, 1)
             layout.setColumnStretch(1, 1)
             layout.setColumnStretch(2, 1)
-            for idx, entry in enumerate(self._filtered_projects):
-                options = ProjectCardOptions(
-                    checkable=self._is_batch_mode,
-                    checked=(entry.project.id in self._selected_ids)
-                )
-                card = ProjectCard(entry, options, parent=new_container)
-                card.openRequested.connect(self.projectOpened.emit)
-                card.pinToggled.connect(self._pin_project)
-                card.manageRequested.connect(self.open_manage_project)
-                card.deleteRequested.connect(self._prompt_delete_project)
-                card.noteRequested.connect(self._open_project_note)
-                card.checkToggled.connect(self._on_card_toggled)
-                layout.addWidget(card, idx // cols, idx % cols)
-            layout.setRowStretch((len(self._filtered_projects) // cols) + 1, 1)
+            layout.setRowStretch((count // cols) + 1, 1)
+            # 先按总行数撑开高度，滚动条范围一开始就是完整的
+            new_container.setMinimumHeight(max(0, -(-count // cols) * _GRID_ROW_H - 24))
+            self._lazy_fill = (layout, cols, _GRID_ROW_H, False)
             
         elif self._view_mode == "list":
             layout = QVBoxLayout(new_container)
             layout.setContentsMargins(0, 0, 0, 0)
             layout.setSpacing(12)
-            for entry in self._filtered_projects:
-                options = ProjectCardOptions(
-                    compact=True,
-                    checkable=self._is_batch_mode,
-                    checked=(entry.project.id in self._selected_ids)
-                )
-                card = ProjectCard(entry, options, parent=new_container)
-                card.openRequested.connect(self.projectOpened.emit)
-                card.pinToggled.connect(self._pin_project)
-                card.manageRequested.connect(self.open_manage_project)
-                card.deleteRequested.connect(self._prompt_delete_project)
-                card.checkToggled.connect(self._on_card_toggled)
-                layout.addWidget(card)
             layout.addStretch()
+            new_container.setMinimumHeight(max(0, count * _LIST_ROW_H - 12))
+            self._lazy_fill = (layout, 1, _LIST_ROW_H, True)
             
         elif self._view_mode == "timeline":
             layout = QVBoxLayout(new_container)
             layout.setContentsMargins(0, 0, 0, 0)
             layout.setSpacing(12)
-            groups: dict[str, list[ProjectEntry]] = {}
-            for entry in self._filtered_projects:
-                key = entry.project.create_time.strftime("%Y-%m")
-                groups.setdefault(key, []).append(entry)
-            
-            for key in sorted(groups.keys(), reverse=True):
-                header = SubtitleLabel(key, new_container)
-                header.setStyleSheet(f"color: {COLORS['primary']}; font-weight: bold; margin-top: 12px;")
-                layout.addWidget(header)
-                for entry in groups[key]:
-                    card = ProjectCard(entry, ProjectCardOptions(compact=True), parent=new_container)
-                    card.openRequested.connect(self.projectOpened.emit)
-                    card.pinToggled.connect(self._pin_project)
-                    card.manageRequested.connect(self.open_manage_project)
-                    card.deleteRequested.connect(self._prompt_delete_project)
-                    layout.addWidget(card)
             layout.addStretch()
+            # 月份标题与卡片高度固定，预先算出各项位置，和网格 / 列表一样滚到再创建
+            y = 0
+            for key, group in self._timeline_groups():
+                self._timeline_items.append((y, key))
+                y += _TIMELINE_HEADER_H
+                for entry in group:
+                    self._timeline_items.append((y, entry))
+                    y += _LIST_ROW_H
+            new_container.setMinimumHeight(max(0, y - 12))
+            self._lazy_fill = (layout, 1, _LIST_ROW_H, True)
+
+        # 旧容器销毁前把没用上的池内卡片摘下来，留待下次复用
+        old_container = self._grid_container
+        for card in self._card_pool.values():
+            if card.parent() is old_container:
+                card.setParent(None)
 
         self._scroll.setWidget(new_container)
         self._grid_container = new_container
+        self._fill_visible()
+        new_container.setUpdatesEnabled(True)
+        self._scroll.setUpdatesEnabled(True)
+        new_container.updateGeometry()
+
+    def _fill_visible(self, *_) -> None:
+        """只为可见区域（外加几行余量）创建卡片，向下滚动时再补"""
+        if self._lazy_fill is None:
+            return
+        layout, cols, row_h, compact = self._lazy_fill
+        bottom = self._scroll.verticalScrollBar().value() + max(self._scroll.viewport().height(), self.height())
+        if self._view_mode == "timeline":
+            self._fill_timeline(layout, bottom + _OVERSCAN_ROWS * row_h)
+            return
+        entries = self._filtered_projects
+        if self._materialized >= len(entries):
+            return
+        end = min(len(entries), (bottom // row_h + 1 + _OVERSCAN_ROWS) * cols)
+        checkable = self._is_batch_mode
+        for idx in range(self._materialized, end):
+            card = self._take_card(entries[idx], compact=compact, checkable=checkable)
+            if isinstance(layout, QGridLayout):
+                layout.addWidget(card, idx // cols, idx % cols)
+            else:
+                layout.insertWidget(layout.count() - 1, card)
+        self._materialized = max(self._materialized, end)
+
+    def _fill_timeline(self, layout: QVBoxLayout, limit_y: int) -> None:
+        items = self._timeline_items
+        idx = self._materialized
+        while idx < len(items) and items[idx][0] < limit_y:
+            item = items[idx][1]
+            if isinstance(item, str):
+                widget = SubtitleLabel(item, self._grid_container)
+                widget.setStyleSheet(_MONTH_HEADER_QSS)
+            else:
+                widget = self._take_card(item, compact=True, checkable=False)
+            layout.insertWidget(layout.count() - 1, widget)
+            idx += 1
+        self._materialized = idx
 
     def _on_view_changed(self, mode: str):
         self._view_mode = mode
@@ -494,7 +1064,7 @@ class DashboardView(QWidget):
         w.viewLayout.addWidget(BodyLabel(content, w))
         w.yesButton.setText(f"删除 {count} 个项目")
         w.cancelButton.setText("取消")
-        w.yesButton.setStyleSheet("QPushButton { background-color: #dc2626; color: white; border: none; } QPushButton:hover { background-color: #b91c1c; }")
+        w.yesButton.setStyleSheet(DESTRUCTIVE_CONFIRM_QSS)
         
         if w.exec():
             success_count = 0
@@ -506,13 +1076,16 @@ class DashboardView(QWidget):
                 if entry.project.id in self._selected_ids:
                     to_delete.append(entry)
             
+            trashed = False
             for entry in to_delete:
                 try:
-                    delete_project_index(Path(self._library_root), entry.project.id)
-                    delete_project_physically(entry.project_dir)
+                    self._queue_index_write(partial(delete_project_index, self._library_root_path, entry.project.id))
+                    trashed |= trash_project_dir(self._library_root_path, entry.project_dir)
                     success_count += 1
                 except Exception as e:
                     errors.append(f"{entry.project.name}: {str(e)}")
+            if trashed:
+                self._start_purge_trash()
             
             self._selected_ids.clear()
             self._is_batch_mode = False # Exit batch mode after delete
@@ -533,61 +1106,56 @@ class DashboardView(QWidget):
     # --- Actions ---
 
     def open_create_project(self):
-        if not self._library_root:
+        if self._library_root_path is None:
             self._show_warning("请先在右侧选择库")
             return
         dlg = CreateProjectDialog(self)
         if dlg.exec():
             try:
-                from dcpm.ui.views.settings_interface import ScanThread
-                
-                res = create_project(Path(self._library_root), dlg.build_request())
-                try: upsert_one_project(Path(self._library_root), ProjectEntry(project=res.project, project_dir=res.project_dir))
-                except: pass
+                res = create_project(self._library_root_path, dlg.build_request())
+                # 写索引（含文件遍历）放到索引线程，随后的加载排在它之后
+                self._queue_index_write(
+                    partial(upsert_one_project, self._library_root_path, ProjectEntry(project=res.project, project_dir=res.project_dir)),
+                    report=False,
+                )
                 
                 self.reload_projects()
                 
                 # Trigger incremental scan
-                cfg = load_user_config()
-                if cfg.inspection_index_enabled and cfg.shared_drive_paths:
-                    self._auto_scan_thread = ScanThread(
-                        Path(self._library_root), 
-                        cfg.shared_drive_paths, 
-                        target_project=res.project
-                    )
-                    self._auto_scan_thread.start()
+                self._queue_targeted_scan(res.project)
                     
             except Exception as e:
                 self._show_error(str(e))
 
     def open_manage_project(self, entry: ProjectEntry):
-        dlg = ManageProjectDialog(entry, self)
-        
-        def _on_delete():
-            if self._prompt_delete_project(entry):
-                dlg.reject()
-
-        dlg.deleteRequested.connect(_on_delete)
+        # 对话框只构造一次，之后每次打开用 load() 换成当前项目
+        dlg = self._manage_dialog
+        if dlg is None:
+            dlg = self._manage_dialog = ManageProjectDialog(entry, self)
+            dlg.deleteRequested.connect(self._on_manage_delete_requested)
+        else:
+            dlg.load(entry)
+        self._manage_entry = entry
 
         if dlg.exec() == QDialog.DialogCode.Accepted:
             try:
                 # Logic same as before
                 if dlg.is_pinned != entry.pinned:
-                    toggle_pinned(Path(self._library_root), entry.project.id, dlg.is_pinned)
+                    self._queue_index_write(partial(toggle_pinned, self._library_root_path, entry.project.id, dlg.is_pinned))
                 
                 desired = dlg.status
-                is_archived_dir = "归档项目" in Path(entry.project_dir).parts
-                root = Path(self._library_root)
+                is_archived_dir = "归档项目" in entry.project_dir.parts
+                root = self._library_root_path
                 
-                final_dir = Path(entry.project_dir)
+                final_dir = entry.project_dir
                 final_project = entry.project
 
                 if desired == "archived" and not is_archived_dir:
-                    res = archive_project(root, Path(entry.project_dir))
+                    res = archive_project(root, entry.project_dir)
                     final_dir = res.project_dir
                     final_project, final_dir = edit_project_metadata(root, final_dir, name=dlg.name, tags=dlg.tags_list, status=desired, description=dlg.description, part_number=dlg.part_number, material=dlg.material, is_special=dlg.is_special)
                 elif desired != "archived" and is_archived_dir:
-                    res = unarchive_project(root, Path(entry.project_dir), status=desired)
+                    res = unarchive_project(root, entry.project_dir, status=desired)
                     final_dir = res.project_dir
                     final_project, final_dir = edit_project_metadata(root, final_dir, name=dlg.name, tags=dlg.tags_list, status=desired, description=dlg.description, part_number=dlg.part_number, material=dlg.material, is_special=dlg.is_special)
                 else:
@@ -598,7 +1166,9 @@ class DashboardView(QWidget):
                 elif dlg.cover_source_path:
                     final_project = set_project_cover(final_dir, dlg.cover_source_path)
 
-                upsert_one_project(root, ProjectEntry(project=final_project, project_dir=final_dir, pinned=dlg.is_pinned))
+                self._queue_index_write(
+                    partial(upsert_one_project, root, ProjectEntry(project=final_project, project_dir=final_dir, pinned=dlg.is_pinned))
+                )
                 QTimer.singleShot(0, self.reload_projects)
                 
                 core_changed = (
@@ -608,23 +1178,83 @@ class DashboardView(QWidget):
                 )
                 
                 if core_changed:
-                    from dcpm.ui.views.settings_interface import ScanThread
-                    cfg = load_user_config()
-                    if cfg.inspection_index_enabled and cfg.shared_drive_paths:
-                        self._auto_scan_thread = ScanThread(
-                            Path(self._library_root), 
-                            cfg.shared_drive_paths, 
-                            target_project=final_project
-                        )
-                        self._auto_scan_thread.start()
+                    self._queue_targeted_scan(final_project)
                         
             except Exception as e:
                 self._show_error(str(e))
 
+    def start_index_task(self, task: QRunnable) -> None:
+        """在索引线程池中执行（与加载、写库按提交顺序串行）"""
+        self._index_pool.start(task)
+
+    def _queue_index_write(self, write: Callable[[], object], report: bool = True) -> None:
+        """写库交给单线程的索引线程池，按提交顺序执行；进行中的那次加载结果已过期，完成后再补一次"""
+        if self._reloading:
+            self._mark_reload_stale()
+        self._index_pool.start(IndexWriteTask(write, self._write_signals if report else None))
+
+    def _queue_targeted_scan(self, project) -> None:
+        cfg = load_user_config()
+        if not (cfg.inspection_index_enabled and cfg.shared_drive_paths):
+            return
+        queued = project.id in self._scan_pending
+        self._scan_pending[project.id] = project
+        if not queued:
+            self._scan_pool.start(
+                TargetedScanTask(self._library_root_path, cfg.shared_drive_paths, project, self._scan_signals)
+            )
+
+    def _on_scan_finished(self, project) -> None:
+        latest = self._scan_pending.pop(project.id, None)
+        if latest is not None and latest is not project:
+            # 排队期间项目又被修改过，用最新数据再扫一次
+            self._queue_targeted_scan(latest)
+
+    def _on_manage_delete_requested(self):
+        if self._manage_entry is not None and self._prompt_delete_project(self._manage_entry):
+            self._manage_dialog.reject()
+
     def _pin_project(self, pid: str, pinned: bool):
-        if not self._library_root: return
-        toggle_pinned(Path(self._library_root), pid, pinned)
-        self.reload_projects()
+        if self._library_root_path is None: return
+        # 写库放到索引线程（排在进行中的加载之后）；那次加载的结果已过期，完成后再补一次
+        if self._reloading:
+            self._mark_reload_stale()
+        self._index_pool.start(PinTask(self._library_root_path, pid, pinned, self._pin_signals))
+        # 置顶不影响统计，只改内存中的条目并重排，不再整库重新加载
+        if self._patch_entry(pid, pinned=pinned) is not None:
+            self._apply_filter()
+
+    def _on_pin_failed(self, pid: str, pinned: bool, err: str) -> None:
+        if self._patch_entry(pid, pinned=not pinned) is not None:
+            self._apply_filter()
+        self._show_error(err)
+
+    def mark_opened(self, pid: str) -> None:
+        """记录打开时间：写库放到索引线程，内存中的条目立即更新"""
+        if self._library_root_path is not None:
+            self._queue_index_write(partial(mark_opened_now, self._library_root_path, pid), report=False)
+        self.patch_last_opened(pid)
+
+    def patch_last_opened(self, pid: str) -> None:
+        """项目被打开后只更新内存中的打开时间与次数，下一轮事件循环再重排"""
+        entry = next((e for e in self._all_projects if e.project.id == pid), None)
+        if entry is None:
+            return
+        self._patch_entry(pid, last_open_time=datetime.now(), open_count=entry.open_count + 1)
+        # 延后重建，避免在卡片按钮的点击处理中替换容器
+        QTimer.singleShot(0, self._apply_filter)
+
+    def _patch_entry(self, pid: str, **changes) -> ProjectEntry | None:
+        """替换一个项目条目，并按索引查询的顺序（置顶优先、最近打开/创建时间倒序）重排"""
+        for i, entry in enumerate(self._all_projects):
+            if entry.project.id == pid:
+                new_entry = replace(entry, **changes)
+                self._all_projects[i] = new_entry
+                self._last_filter_key = None
+                self._all_projects.sort(key=lambda e: e.last_open_time or e.project.create_time, reverse=True)
+                self._all_projects.sort(key=lambda e: not e.pinned)
+                return new_entry
+        return None
 
     def _open_project_note(self, entry: ProjectEntry):
         if not self._note_service: return
@@ -645,14 +1275,17 @@ class DashboardView(QWidget):
         w.viewLayout.addWidget(BodyLabel(content, w))
         w.yesButton.setText("确认删除")
         w.cancelButton.setText("取消")
-        w.yesButton.setStyleSheet("QPushButton { background-color: #dc2626; color: white; border: none; } QPushButton:hover { background-color: #b91c1c; }")
+        w.yesButton.setStyleSheet(DESTRUCTIVE_CONFIRM_QSS)
         
         if w.exec():
             try:
-                delete_project_index(Path(self._library_root), entry.project.id)
-                delete_project_physically(entry.project_dir)
+                # 索引删除排进索引线程池，不在界面线程等待写锁
+                self._queue_index_write(partial(delete_project_index, self._library_root_path, entry.project.id))
+                # 只改名移入回收目录，文件在后台删除
+                if trash_project_dir(self._library_root_path, entry.project_dir):
+                    self._start_purge_trash()
                 self.reload_projects()
-                self._show_success(f"项目 {entry.project.name} 已彻底移除")
+                self._show_success(f"项目 {entry.project.name} 已删除")
                 return True
             except Exception as e:
                 self._show_error(str(e))
@@ -660,7 +1293,7 @@ class DashboardView(QWidget):
         return False
 
     def rebuild_index_action(self):
-        if not self._library_root: return
+        if self._library_root_path is None: return
         
         # 防止重复点击
         if hasattr(self, '_rebuild_thread') and self._rebuild_thread and self._rebuild_thread.isRunning():
@@ -679,7 +1312,7 @@ class DashboardView(QWidget):
         )
         
         # 启动后台线程
-        self._rebuild_thread = RebuildIndexThread(Path(self._library_root), self)
+        self._rebuild_thread = RebuildIndexThread(self._library_root_path, self)
         self._rebuild_thread.finished.connect(self._on_rebuild_finished)
         self._rebuild_thread.error.connect(self._on_rebuild_error)
         self._rebuild_thread.progress.connect(self._on_rebuild_progress)
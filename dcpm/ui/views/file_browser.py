@@ -17,7 +17,7 @@ from qfluentwidgets import (
     Pivot
 )
 
-from dcpm.ui.theme.colors import COLORS
+from dcpm.ui.theme.colors import COLORS, DESTRUCTIVE_CONFIRM_QSS
 from dcpm.services.note_service import NoteService
 from dcpm.services.tag_service import TagService
 from dcpm.services.thumbnail_service import ThumbnailService
@@ -30,6 +30,7 @@ from dcpm.ui.dialogs.input_dialog import InputDialog
 
 class FileBrowser(QWidget):
     backRequested = pyqtSignal()
+    itemTagsChanged = pyqtSignal()  # 当前项目的文件标签被修改（看板中的项目数据随之过期）
 
     def __init__(self, library_root: Path, parent=None):
         super().__init__(parent)
@@ -359,6 +360,14 @@ class FileBrowser(QWidget):
         self._update_breadcrumbs(path)
         self.list_view.viewport().update()
 
+    def _set_item_tags(self, item_tags: dict[str, list[str]]) -> None:
+        """写入后的标签表；确有变化时才通知外部"""
+        changed = item_tags != self._item_tags
+        self._item_tags = item_tags
+        self.list_view.viewport().update()
+        if changed:
+            self.itemTagsChanged.emit()
+
     def _rel_path_for_fs_path(self, fs_path: str) -> str:
         if not self.project_root:
             return ""
@@ -419,11 +428,9 @@ class FileBrowser(QWidget):
             tags = self.tag_service.parse_tags_text(w.get_text())
             try:
                 if len(rel_paths) == 1:
-                    self._item_tags = self.tag_service.set_item_tags(self.project_root, rel_paths[0], tags)
+                    self._set_item_tags(self.tag_service.set_item_tags(self.project_root, rel_paths[0], tags))
                 else:
-                    self._item_tags = self.tag_service.batch_set_item_tags(self.project_root, rel_paths, tags)
-                
-                self.list_view.viewport().update()
+                    self._set_item_tags(self.tag_service.batch_set_item_tags(self.project_root, rel_paths, tags))
                 
                 msg = "标签已更新"
                 if len(rel_paths) > 1:
@@ -723,8 +730,7 @@ class FileBrowser(QWidget):
                     new_rel = self._rel_path_for_fs_path(str(new_path))
                     if self.project_root and old_rel and new_rel:
                         try:
-                            self._item_tags = self.tag_service.move_item(self.project_root, old_rel, new_rel)
-                            self.list_view.viewport().update()
+                            self._set_item_tags(self.tag_service.move_item(self.project_root, old_rel, new_rel))
                         except Exception:
                             pass
                 except Exception as e:
@@ -747,7 +753,7 @@ class FileBrowser(QWidget):
         w.viewLayout.addWidget(BodyLabel(f"确定要永久删除 '{name}' 吗？\n此操作不可恢复！", w))
         w.yesButton.setText("删除")
         w.cancelButton.setText("取消")
-        w.yesButton.setStyleSheet("QPushButton { background-color: #dc2626; color: white; border: none; } QPushButton:hover { background-color: #b91c1c; }")
+        w.yesButton.setStyleSheet(DESTRUCTIVE_CONFIRM_QSS)
         
         if w.exec():
             try:
@@ -757,8 +763,7 @@ class FileBrowser(QWidget):
                     os.remove(path)
                 if self.project_root and rel:
                     try:
-                        self._item_tags = self.tag_service.delete_item(self.project_root, rel, is_dir=is_dir)
-                        self.list_view.viewport().update()
+                        self._set_item_tags(self.tag_service.delete_item(self.project_root, rel, is_dir=is_dir))
                     except Exception:
                         pass
             except Exception as e:
@@ -96,6 +96,7 @@ class RightPanel(QWidget):
         
         self.tags_grid = QGridLayout()
         self.tags_grid.setSpacing(8)
+        self._shown_tags: tuple = ()  # (标签数据, 选中集合)，未变化时不重建按钮
         self.tags_layout.addLayout(self.tags_grid)
         
         layout.addWidget(tags_card)
@@ -118,13 +119,17 @@ class RightPanel(QWidget):
         layout.addStretch()
 
     def update_tags(self, tags: list[tuple[str, int]], selected_tags: set[str]):
+        shown = (tuple(tags[:10]), frozenset(selected_tags))
+        if shown == self._shown_tags:
+            return
+        self._shown_tags = shown
         # 清除旧标签
         while self.tags_grid.count():
             item = self.tags_grid.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
         
-        for i, (tag, count) in enumerate(tags[:10]): # Top 10
+        for i, (tag, count) in enumerate(shown[0]): # Top 10
             btn = QPushButton(f"#{tag}  {count}")
             btn.setCheckable(True)
             btn.setChecked(tag in selected_tags)
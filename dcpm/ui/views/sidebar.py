@@ -9,6 +9,14 @@ from qfluentwidgets import IconWidget, FluentIcon as FI
 
 from dcpm.ui.theme.colors import COLORS
 
+# 侧边栏样式表：索引状态标签按 objectName + indexed 属性切换颜色，不再逐次拼样式串
+_SIDEBAR_QSS = f"""
+    * {{ background-color: {COLORS['bg']}; border-right: 1px solid {COLORS['border']}; }}
+    QLabel#indexStatus {{ font-size: 11px; }}
+    QLabel#indexStatus[indexed="true"] {{ color: {COLORS['success']}; }}
+    QLabel#indexStatus[indexed="false"] {{ color: {COLORS['warning']}; }}
+"""
+
 class SidebarWidget(QWidget):
     """精致的左侧导航 - 参考 main_v2.py"""
     
@@ -17,7 +25,7 @@ class SidebarWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedWidth(260)
-        self.setStyleSheet(f"background-color: {COLORS['bg']}; border-right: 1px solid {COLORS['border']};")
+        self.setStyleSheet(_SIDEBAR_QSS)
         self.setupUI()
         
     def setupUI(self):
@@ -120,6 +128,7 @@ class SidebarWidget(QWidget):
         
         self.month_container = QVBoxLayout()
         self.month_container.setSpacing(4)
+        self._shown_months: tuple = ()  # 当前显示的月份数据，未变化时不重建按钮
         layout.addLayout(self.month_container)
         
         layout.addStretch()
@@ -162,7 +171,8 @@ class SidebarWidget(QWidget):
         info_layout.addWidget(name_label)
         
         self.index_status = QLabel("索引正常")
-        self.index_status.setStyleSheet(f"color: {COLORS['success']}; font-size: 11px;")
+        self.index_status.setObjectName("indexStatus")
+        self.index_status.setProperty("indexed", True)
         info_layout.addWidget(self.index_status)
         
         user_layout.addLayout(info_layout)
@@ -189,8 +199,22 @@ class SidebarWidget(QWidget):
         except RuntimeError:
             return True
 
-    def update_months(self, months: list[tuple[str, str, int]]):
-        # months: [(display_name, key, count), ...]
+    def set_index_state(self, enabled: bool):
+        """切换 indexed 属性并重新 polish，颜色由样式表里的属性选择器决定"""
+        self.index_status.setText("索引已启用" if enabled else "普通模式")
+        if self.index_status.property("indexed") == enabled:
+            return
+        self.index_status.setProperty("indexed", enabled)
+        style = self.index_status.style()
+        style.unpolish(self.index_status)
+        style.polish(self.index_status)
+
+    def update_months(self, months: list[tuple[str, int]]):
+        # months: [("YYYY-MM", count), ...]，导航 key 只为显示出来的几个月生成
+        shown = tuple(months[:5]) # 只显示前5个月
+        if shown == self._shown_months:
+            return
+        self._shown_months = shown
         # 清除旧的月份按钮
         while self.month_container.count():
             item = self.month_container.takeAt(0)
@@ -203,7 +227,8 @@ class SidebarWidget(QWidget):
                      self.nav_group.remove(widget)
                 widget.deleteLater()
         
-        for name, key, count in months[:5]: # 只显示前5个月
+        for name, count in shown:
+            key = f"month:{name}"
             btn_widget = QWidget()
             btn_layout = QHBoxLayout(btn_widget)
             btn_layout.setContentsMargins(0, 0, 0, 0)